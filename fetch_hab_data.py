@@ -9,32 +9,37 @@ import json
 import os
 import re
 import time
+import functools
 from datetime import datetime, timedelta
-import pytz
+from zoneinfo import ZoneInfo
 import gspread
 from google.oauth2.service_account import Credentials
 from pathlib import Path
 
+from hab_abundance import parse_abundance_to_status
+
 def load_env_file(env_file_path='.env'):
     """Load environment variables from .env file"""
     env_path = Path(env_file_path)
     
     if env_path.exists():
         print(f"📁 Loading environment variables from {env_file_path}")
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    
-                    # Remove quotes if present
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    
-                    os.environ[key] = value
+        # Parse everything first, then apply in one update
+        parsed = {}
+        for line in env_path.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+                
+                # Remove quotes if present
+                if (value.startswith('"') and value.endswith('"')) or \
+                   (value.startswith("'") and value.endswith("'")):
+                    value = value[1:-1]
+                
+                parsed[key] = value
+        os.environ.update(parsed)
         print("✅ Environment variables loaded from .env file")
     else:
         print("⚠️  No .env file found, using system environment variables")
@@ -42,6 +47,20 @@ def load_env_file(env_file_path='.env'):
 # Load environment variables at module level
 load_env_file()
 
+# Slug patterns, compiled once for _generate_slug
+_RE_NONALNUM = re.compile(r'[^a-z0-9\s-]')
+_RE_WS = re.compile(r'\s+')
+_RE_DASH = re.compile(r'-+')
+
+@functools.lru_cache(maxsize=4096)
+def _generate_slug(name):
+    """Generate URL-friendly slug in format: <location-name>-red-tide (memoized, names repeat per run)"""
+    slug = _RE_NONALNUM.sub('', name.lower())
+    slug = _RE_WS.sub('-', slug)
+    slug = _RE_DASH.sub('-', slug)
+    slug = slug.strip('-')
+    return f"{slug}-red-tide"
+
 class HABDataFetcher:
     def __init__(self):
         # API Configuration
@@ -55,6 +74,9 @@ class HABDataFetcher:
         if self.test_mode:
             print(f"🧪 Running in TEST MODE (limited to {self.test_limit} locations)")
         
+        # Resolve the Eastern timezone once for sheet timestamps
+        self._eastern = ZoneInfo('America/New_York')
+        
         # Google Sheets Setup
         self._init_google_sheets()
         
@@ -107,9 +129,7 @@ class HABDataFetcher:
             mapping = {}
             for record in records:
                 beach_name = record['beach']
-                if beach_name not in mapping:
-                    mapping[beach_name] = []
-                mapping[beach_name].append(record)
+                mapping.setdefault(beach_name, []).append(record)
             
             print(f"Loaded sample mappings for {len(mapping)} beaches")
             return mapping
@@ -123,8 +143,8 @@ class HABDataFetcher:
         
         params = {
             'where': '1=1',
-            'outFields': '*',
-            'outSR': '4326',
+            'outFields': 'HAB_ID,SAMPLE_DATE,Abundance,LOCATION',  # Only the attributes _find_hab_data_* read
+            'returnGeometry': 'false',  # Feature geometry is never read
             'f': 'json',
             'orderByFields': 'SAMPLE_DATE DESC',
             'resultRecordCount': 1000  # Get more recent records
@@ -195,38 +215,7 @@ class HABDataFetcher:
     
     def parse_abundance_to_status(self, abundance_text):
         """Convert FWC abundance categories to status and cell count"""
-        if not abundance_text:
-            return 0, 'no_data'
-        
-        abundance_lower = abundance_text.lower()
-        
-        # Extract numbers from text
-        numbers = re.findall(r'[\d,]+', abundance_text)
-        
-        if 'not present' in abundance_lower or 'background' in abundance_lower:
-            return 500, 'safe'
-        elif 'very low' in abundance_lower:
-            return 2500, 'safe'
-        elif 'low' in abundance_lower and 'very' not in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'caution'
-            return 5000, 'caution'
-        elif 'medium' in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'avoid'
-            return 50000, 'avoid'
-        elif 'high' in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'avoid'
-            return 500000, 'avoid'
-        
-        return 0, 'no_data'
+        return parse_abundance_to_status(abundance_text)
     
     def calculate_beach_status(self, beach_name, fwc_data):
         """Calculate beach status from HAB sampling sites"""
@@ -248,6 +237,8 @@ class HABDataFetcher:
         site_results = []
         weighted_scores = []
         latest_sample_date = None
+        # One clock reading so every site is aged (and defaulted) against the same instant
+        now = datetime.now()
         
         # Process each sampling site
         for site in sampling_sites:
@@ -273,9 +264,9 @@ class HABDataFetcher:
                             sample_date = datetime.fromtimestamp(sample_date_raw / 1000)
                     except (ValueError, TypeError):
                         # If date parsing fails, use current date
-                        sample_date = datetime.now()
+                        sample_date = now
                 else:
-                    sample_date = datetime.now()
+                    sample_date = now
                 
                 # Update latest sample date
                 if not latest_sample_date or sample_date > latest_sample_date:
@@ -292,7 +283,7 @@ class HABDataFetcher:
                     weight = 0.2
                 
                 # Age weighting (reduce weight for old samples)
-                age_days = (datetime.now() - sample_date).days
+                age_days = (now - sample_date).days
                 age_weight = max(0.1, 1 - (age_days / 7.0)) if age_days > 7 else 1.0
                 
                 final_weight = weight * age_weight
@@ -362,6 +353,7 @@ class HABDataFetcher:
         sample_location_lower = sample_location.lower()
         best_match = None
         best_score = 0
+        now = datetime.now()
         
         for feature in features:
             attrs = feature.get('attributes', {})
@@ -378,7 +370,7 @@ class HABDataFetcher:
                         else:
                             # Assume it's already a timestamp number
                             sample_date = datetime.fromtimestamp(sample_date_raw / 1000)
-                        age_days = (datetime.now() - sample_date).days
+                        age_days = (now - sample_date).days
                         score = max(0, 10 - age_days)  # Prefer recent samples
                     except (ValueError, TypeError):
                         # If date parsing fails, use a default score
@@ -410,8 +402,10 @@ class HABDataFetcher:
             
 
                 
-            if city_name not in city_data:
-                city_data[city_name] = {
+            # One lookup per beach; the city entry is only built on first sight
+            city = city_data.get(city_name)
+            if city is None:
+                city = city_data[city_name] = {
                     'location_name': city_name,
                     'location_type': 'city',
                     'beaches': [],
@@ -419,7 +413,7 @@ class HABDataFetcher:
                     'slug': self._generate_slug(city_name)
                 }
             
-            city_data[city_name]['beaches'].append(beach)
+            city['beaches'].append(beach)
         
         # Calculate aggregates for each city
         city_results = []
@@ -473,15 +467,16 @@ class HABDataFetcher:
             if not region_name:
                 continue
                 
-            if region_name not in region_data:
-                region_data[region_name] = {
+            region = region_data.get(region_name)
+            if region is None:
+                region = region_data[region_name] = {
                     'beaches': [],
                     'cities': set()
                 }
             
-            region_data[region_name]['beaches'].append(beach)
+            region['beaches'].append(beach)
             if beach['city']:
-                region_data[region_name]['cities'].add(beach['city'])
+                region['cities'].add(beach['city'])
         
         # Calculate aggregates for each region
         region_results = []
@@ -528,12 +523,7 @@ class HABDataFetcher:
     
     def _generate_slug(self, name):
         """Generate URL-friendly slug in format: <location-name>-red-tide"""
-        slug = name.lower()
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'\s+', '-', slug)
-        slug = re.sub(r'-+', '-', slug)
-        slug = slug.strip('-')
-        return f"{slug}-red-tide"
+        return _generate_slug(name)
     
     def update_google_sheets(self, all_results):
         """Append new data to beach_status sheet (maintaining history)"""
@@ -558,7 +548,7 @@ class HABDataFetcher:
             
             # Add all results (appending to existing data)
             today = datetime.now().strftime('%Y-%m-%d')
-            timestamp = datetime.now(pytz.timezone('US/Eastern')).strftime('%Y-%m-%d %H:%M:%S')
+            timestamp = datetime.now(self._eastern).strftime('%Y-%m-%d %H:%M:%S')
             
             for result in all_results:
                 row = [
@@ -0,0 +1,47 @@
+#!/usr/bin/env python3
+"""
+FWC Abundance Parsing
+Turns FWC HAB abundance text into a cell count and beach status.
+No Google Sheets or .env loading here, so the offline test scripts can import it.
+"""
+
+import re
+import functools
+
+# Cell-count numbers inside FWC abundance text, e.g. "low (>10,000 - 100,000 cells/L)"
+_RE_COUNT = re.compile(r'[\d,]+')
+
+# FWC abundance categories, checked in order: (keywords, excluded word, default cells/L, status, use stated range)
+ABUNDANCE_LEVELS = (
+    (('not present', 'background'), None, 500, 'safe', False),
+    (('very low',), None, 2500, 'safe', False),
+    (('low',), 'very', 5000, 'caution', True),
+    (('medium',), None, 50000, 'avoid', True),
+    (('high',), None, 500000, 'avoid', True),
+)
+
+@functools.lru_cache(maxsize=64)
+def _parse_abundance(abundance_text):
+    """(cell count, status) for a non-empty FWC abundance string (memoized, FWC uses a handful of category strings)"""
+    abundance_lower = abundance_text.lower()
+    for keywords, excluded, default_count, status, use_range in ABUNDANCE_LEVELS:
+        if not any(keyword in abundance_lower for keyword in keywords):
+            continue
+        if excluded and excluded in abundance_lower:
+            continue
+        
+        # Use the midpoint of a stated range such as "100,000 - 1,000,000 cells/L"
+        numbers = _RE_COUNT.findall(abundance_text) if use_range else []
+        if len(numbers) >= 2:
+            low = int(numbers[0].replace(',', ''))
+            high = int(numbers[1].replace(',', ''))
+            return (low + high) // 2, status
+        return default_count, status
+    
+    return 0, 'no_data'
+
+def parse_abundance_to_status(abundance_text):
+    """Convert an FWC abundance category to (cell count, status); blank or missing text means no data"""
+    if not abundance_text:
+        return 0, 'no_data'
+    return _parse_abundance(abundance_text)
@@ -5,14 +5,27 @@ Reads data from Google Sheets and creates/updates WordPress posts via REST API
 """
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import json
+import hashlib
 import os
+import sys
 import time
-import re
+import logging
 import math
+import random
+import functools
+import threading
+from collections import namedtuple
+from concurrent.futures import ThreadPoolExecutor
+from itertools import islice
+from dataclasses import dataclass, fields
 from datetime import datetime
-import pytz
+from zoneinfo import ZoneInfo
 import gspread
+from gspread.exceptions import APIError
+from gspread.utils import absolute_range_name, numericise_all
 from google.oauth2.service_account import Credentials
 from pathlib import Path
 
@@ -23,22 +36,283 @@ def load_env_file(env_file_path='.env'):
     
     if env_path.exists():
         print(f"📁 Loading environment variables from {env_path}")
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    os.environ[key] = value
+        # Parse everything first, then apply in one update
+        parsed = {}
+        for line in env_path.read_text().splitlines():
+            line = line.strip()
+            if line and not line.startswith('#') and '=' in line:
+                key, value = line.split('=', 1)
+                key = key.strip()
+                value = value.strip()
+                if (value.startswith('"') and value.endswith('"')) or \
+                   (value.startswith("'") and value.endswith("'")):
+                    value = value[1:-1]
+                parsed[key] = value
+        os.environ.update(parsed)
         print("✅ Environment variables loaded")
 
 # Load environment variables
 load_env_file()
 
+log = logging.getLogger(__name__)
+
+# Earth's radius in miles, and the nearby cut-offs expressed as the haversine 'a' term
+# (a grows with distance, so candidates can be rejected before asin/sqrt)
+EARTH_RADIUS_MILES = 3959
+NEARBY_BEACH_HAVERSINE_A = math.sin(25.0 / (2 * EARTH_RADIUS_MILES)) ** 2  # 25 miles
+NEARBY_CITY_BEACH_HAVERSINE_A = math.sin(15.0 / (2 * EARTH_RADIUS_MILES)) ** 2  # 15 miles
+# The same cut-offs as a latitude difference in radians; pairs further apart north-south are out of range
+NEARBY_BEACH_MAX_DLAT = 25.0 / EARTH_RADIUS_MILES
+NEARBY_CITY_BEACH_MAX_DLAT = 15.0 / EARTH_RADIUS_MILES
+
+# Google Sheets quota: 60 read requests per minute per user
+SHEETS_REQUESTS_PER_MINUTE = 60
+SHEETS_MAX_RETRIES = 6
+
+# sync_post_type's existing_ids default: nothing listed yet (None means the listing was tried and failed)
+_NOT_LISTED = object()
+
+class TokenBucket:
+    """Thread-safe token bucket; penalize() halves the refill rate until a cooldown passes"""
+    
+    def __init__(self, rate, capacity, cooldown=60.0):
+        # rate is tokens per second; None disables limiting
+        self.base_rate = rate
+        self.rate = rate
+        self.capacity = float(capacity)
+        self.cooldown = cooldown
+        self.tokens = float(capacity)
+        self.last_refill = time.monotonic()
+        self.penalized_until = 0.0
+        self._lock = threading.Lock()
+    
+    def take(self):
+        """Take one token, sleeping until the bucket refills if empty"""
+        if self.base_rate is None:
+            return
+        
+        with self._lock:
+            now = time.monotonic()
+            if self.rate < self.base_rate and now >= self.penalized_until:
+                self.rate = self.base_rate
+            
+            self.tokens = min(self.capacity, self.tokens + (now - self.last_refill) * self.rate)
+            self.last_refill = now
+            
+            if self.tokens < 1:
+                time.sleep((1 - self.tokens) / self.rate)
+                self.tokens = 1.0
+                self.last_refill = time.monotonic()
+            
+            self.tokens -= 1
+    
+    def penalize(self):
+        """Halve the refill rate after a 429; take() restores it once the cooldown has passed"""
+        if self.base_rate is None:
+            return
+        
+        with self._lock:
+            self.rate = max(self.rate / 2, self.base_rate / 16)
+            self.penalized_until = time.monotonic() + self.cooldown
+
+def with_sheets_backoff(func):
+    """Retry a Google Sheets call on 429 or a quota error with exponential backoff and jitter"""
+    @functools.wraps(func)
+    def wrapper(self, *args, **kwargs):
+        for attempt in range(SHEETS_MAX_RETRIES + 1):
+            self.buckets['gs'].take()
+            try:
+                return func(self, *args, **kwargs)
+            except APIError as e:
+                status_code = getattr(e.response, 'status_code', None)
+                rate_limited = status_code == 429 or "quota exceeded" in str(e).lower()
+                if not rate_limited or attempt == SHEETS_MAX_RETRIES:
+                    raise
+                self.buckets['gs'].penalize()
+                
+                # Honor the server's Retry-After when present, otherwise back off exponentially
+                headers = getattr(e.response, 'headers', None) or {}
+                retry_after = headers.get('Retry-After')
+                try:
+                    wait_time = float(retry_after)
+                except (TypeError, ValueError):
+                    wait_time = 2 ** attempt + random.random()
+                
+                print(f"⚠️  Sheets rate limit hit (attempt {attempt + 1}/{SHEETS_MAX_RETRIES}). Waiting {wait_time:.1f} seconds...")
+                time.sleep(wait_time)
+    return wrapper
+
+# (title, meta description) templates per post type
+POST_TEMPLATES = {
+    'beach': (
+        "{name} Red Tide Status - Current Conditions & Updates",
+        "Current red tide conditions at {name}. Real-time HAB monitoring data, safety information, and beach status updates."
+    ),
+    'city': (
+        "{name} Red Tide Status - All Beaches Current Conditions",
+        "Red tide conditions for all beaches in {name}, FL. Current status, safety advisories, and detailed monitoring data."
+    ),
+    'region': (
+        "{name} Red Tide Status - Regional Overview & Beach Conditions",
+        "Comprehensive red tide monitoring for {name}. Track conditions across all beaches and cities in the region."
+    )
+}
+
+# Status-specific descriptions per post type; unknown statuses use 'no_data'
+DESCRIPTION_TEMPLATES = {
+    'beach': {
+        'safe': "{name} in {city}, Florida currently has safe red tide conditions with low cell counts ({peak_count} cells/L). The beach is open for swimming and recreation.",
+        'caution': "{name} in {city}, Florida is experiencing moderate red tide conditions ({peak_count} cells/L). Visitors should exercise caution and check for any posted advisories.",
+        'avoid': "{name} in {city}, Florida has high red tide levels ({peak_count} cells/L). Swimming and water activities are not recommended at this time.",
+        'no_data': "{name} in {city}, Florida. Current red tide monitoring data is being collected to assess conditions."
+    },
+    'city': {
+        'safe': "{name} in {region}, Florida has {beach_count} monitored beaches, all currently showing safe red tide conditions. The area is open for beach activities.",
+        'caution': "{name} in {region}, Florida has {beach_count} monitored beaches with some showing moderate red tide conditions. Check individual beach status before visiting.",
+        'avoid': "{name} in {region}, Florida has {beach_count} monitored beaches with high red tide levels. Beach activities are not recommended at this time.",
+        'no_data': "{name} in {region}, Florida has {beach_count} monitored beaches. Current red tide monitoring data is being collected."
+    },
+    'region': {
+        'safe': "{name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches, all currently showing safe red tide conditions.",
+        'caution': "{name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches with some areas showing moderate red tide conditions.",
+        'avoid': "{name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches with high red tide levels affecting multiple areas.",
+        'no_data': "{name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches. Comprehensive red tide monitoring is ongoing."
+    }
+}
+
+def memoize_per_sync(func):
+    """Cache a lookup helper's result per argument tuple until clear_cache() or the next run()"""
+    @functools.wraps(func)
+    def wrapper(self, *args):
+        key = (func.__name__, args)
+        if key in self._sync_memo:
+            return self._sync_memo[key]
+        result = func(self, *args)
+        self._sync_memo[key] = result
+        return result
+    return wrapper
+
+@dataclass(slots=True, kw_only=True)
+class AcfPayload:
+    """ACF fields shared by every post type"""
+    location_name: str
+    current_status: str
+    status_color: str
+    last_updated: str
+    url_slug: str
+    region: str | None
+    state: str = 'FL'
+    featured_location: bool = False
+    
+    def to_dict(self):
+        """Shallow conversion to the dict sent as the post's 'acf' payload"""
+        return {f.name: getattr(self, f.name) for f in fields(self)}
+
+@dataclass(slots=True, kw_only=True)
+class BeachAcf(AcfPayload):
+    """ACF fields for beach posts"""
+    city: str | None
+    coordinates: dict | None
+    full_address: str | None
+    zip_code: str | None
+    peak_count: int
+    confidence_score: int
+    sample_date: str | None
+    parent_city_post: int | None
+    parent_region_post: int | None
+    sampling_sites: list
+    beach_description: str
+    nearby_beaches: list
+    nearby_regions: list
+
+@dataclass(slots=True, kw_only=True)
+class CityAcf(AcfPayload):
+    """ACF fields for city posts"""
+    beaches_safe: int
+    beaches_caution: int
+    beaches_avoid: int
+    child_beaches: list
+    parent_region: int | None
+    peak_cell_count: int
+    average_cell_count: int
+    average_confidence: int
+    latest_sample_data: str | None
+    total_beaches: int
+    city_description: str
+    nearby_cities: list
+    nearby_beaches: list
+
+@dataclass(slots=True, kw_only=True)
+class RegionAcf(AcfPayload):
+    """ACF fields for region posts"""
+    peak_count: int
+    avg_count: int
+    confidence_score: int
+    sample_date: str | None
+    beach_count: int
+    beaches_safe: int
+    beaches_caution: int
+    beaches_avoid: int
+    city_count: int
+    total_beaches: int
+    total_cities: int
+    child_beaches: list
+    child_cities: list
+    region_description: str
+    nearby_regions: list
+
+def _as_int(data, key):
+    """Read a numeric sheet value as int, treating blanks as 0"""
+    return int(data.get(key, 0) or 0)
+
+def _or_none(data, key):
+    """Read a sheet value, mapping blanks to None for ACF"""
+    return data.get(key) or None
+
+# One sample_mapping row, converted (and stringified for ACF) once at load
+HabSample = namedtuple('HabSample', 'beach hab_id sample_location distance_miles cell_count sample_date')
+
+def _payload_hash(post_payload):
+    """Stable SHA-256 of a post payload, ignoring the per-run last_updated stamp"""
+    acf = {k: v for k, v in post_payload['acf'].items() if k != 'last_updated'}
+    normalized = {**post_payload, 'acf': acf}
+    encoded = json.dumps(normalized, sort_keys=True, separators=(',', ':'), default=str)
+    return hashlib.sha256(encoded.encode('utf-8')).hexdigest()
+
+@functools.lru_cache(maxsize=None)
+def _search_slug(name):
+    """Slug used to look up an existing post by location name (memoized, the same names recur across lookups)"""
+    return f"{name.lower().replace(' ', '-')}-red-tide"
+
+def _rows_to_records(values):
+    """Turn worksheet rows (header row first) into dicts the way get_all_records() does"""
+    if not values:
+        return []
+    
+    # Disambiguate repeated headers deterministically (status, status_2, ...) instead of failing
+    headers = []
+    used = set()
+    renamed = []
+    for header in values[0]:
+        name, count = header, 1
+        while name in used:
+            count += 1
+            name = f"{header}_{count}"
+        if name != header:
+            renamed.append(name)
+        used.add(name)
+        headers.append(name)
+    
+    if renamed:
+        log.warning("⚠️  Duplicate sheet headers read as %s; check the header row with utilities/verify_sheet_headers.py",
+                    ', '.join(renamed))
+    
+    width = len(headers)
+    return [
+        dict(zip(headers, numericise_all(row + [''] * (width - len(row)))))
+        for row in values[1:]
+    ]
+
 class WordPressSyncer:
     def __init__(self):
         # WordPress Configuration
@@ -54,16 +328,41 @@ class WordPressSyncer:
         
         # Rate limiting and caching
         self.sheet_cache = {}
-        self.last_api_call = 0
+        self._sheet_cache_lock = threading.Lock()
         # Adjust rate limiting based on environment (more conservative for production)
         rate_limit_str = os.environ.get('API_RATE_LIMIT_SECONDS', '1.1')
         self.min_call_interval = float(rate_limit_str)
         print(f"⏱️  API rate limiting: {self.min_call_interval}s between calls")
         
+        # Number of posts synced concurrently (calls still share the rate limiter)
+        concurrency_str = os.environ.get('SYNC_CONCURRENCY', '8')
+        self.sync_concurrency = max(1, int(concurrency_str)) if concurrency_str.strip() else 8
+        print(f"🧵 Sync concurrency: {self.sync_concurrency} posts at a time")
+        
+        # Resolve the Eastern timezone once; the run timestamp is shared by every post
+        self._eastern = ZoneInfo('America/New_York')
+        self._run_timestamp = datetime.now(self._eastern).strftime('%Y-%m-%d %H:%M:%S')
+        
+        # Separate client-side token buckets so WordPress and Google Sheets each use their own quota;
+        # a one-token WordPress bucket keeps the configured spacing between calls
+        self.buckets = {
+            'wp': TokenBucket(rate=1 / self.min_call_interval if self.min_call_interval > 0 else None, capacity=1),
+            'gs': TokenBucket(rate=SHEETS_REQUESTS_PER_MINUTE / 60.0, capacity=SHEETS_REQUESTS_PER_MINUTE)
+        }
+        
         # ACF configuration
         self.use_relationship_fields = os.environ.get('USE_ACF_RELATIONSHIPS', 'true').lower() == 'true'
         print(f"🔗 ACF relationship fields: {'enabled' if self.use_relationship_fields else 'disabled'}")
         
+        # Opt-in: skip posts whose payload hash (stored in _syncer_hash post meta) is unchanged.
+        # Skipped posts keep their previous acf.last_updated, so this is off by default.
+        self.skip_unchanged = os.environ.get('SKIP_UNCHANGED_POSTS', 'false').lower() == 'true'
+        self.existing_hashes = {}
+        
+        # (post_type, slug) -> post ID, filled from the paginated listings and every lookup/upsert
+        self.post_index = {}
+        self.indexed_post_types = set()
+        
         if self.test_mode:
             print(f"🧪 Running in TEST MODE (limited to {self.test_limit} posts per type)")
         
@@ -73,6 +372,30 @@ class WordPressSyncer:
         # Authentication
         self.auth = (self.wp_username, self.wp_password)
         
+        # Post type -> REST base; confirmed against /types in _test_wordpress_auth
+        self.rest_endpoints = {
+            'beach': 'beaches',
+            'city': 'cities',
+            'region': 'regions'
+        }
+        
+        # Shared HTTP session so WordPress calls reuse pooled keep-alive connections;
+        # the pool is sized so every sync worker can hold its own connection
+        self.http = requests.Session()
+        self.http.auth = self.auth
+        # Transient 429/5xx answers are retried with backoff (honouring Retry-After); urllib3 only
+        # retries idempotent methods by default, so post creates are never sent twice
+        retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 500, 502, 503, 504], raise_on_status=False)
+        adapter = HTTPAdapter(pool_connections=4, pool_maxsize=max(10, self.sync_concurrency), max_retries=retries)
+        self.http.mount('https://', adapter)
+        self.http.mount('http://', adapter)
+        # A 429 that survives the adapter retries slows the WordPress bucket down
+        self.http.hooks['response'].append(self._on_wordpress_response)
+        
+        # One (connect, read) deadline for every WordPress request
+        timeout_str = os.environ.get('WP_REQUEST_TIMEOUT', '15')
+        self.request_timeout = (5, float(timeout_str) if timeout_str.strip() else 15.0)
+        
         # Google Sheets Setup (skip if WordPress-only test)
         if not self.wordpress_test_only:
             self._init_google_sheets()
@@ -81,22 +404,37 @@ class WordPressSyncer:
         self._test_wordpress_auth()
         
         # Preload all sheet data to minimize API calls
+        self.city_to_hab_samples = None
+        self.beach_to_hab_samples = None
+        self.location_by_beach = None
+        self.status_by_region_type = None
+        self.status_by_type = None
+        self.status_by_type_city = None
+        self._sync_memo = {}
+        self._deferred_relinks = []
+        # location name -> post ID per type, for child/nearby links; filled by the prefetch and every upsert
+        self.location_to_post_id = {'beach': {}, 'city': {}, 'region': {}}
         if not self.wordpress_test_only:
             self._preload_sheet_data()
         
         print("✅ WordPress syncer initialized successfully")
     
     def _rate_limit(self):
-        """Ensure minimum time between API calls"""
-        current_time = time.time()
-        time_since_last = current_time - self.last_api_call
-        if time_since_last < self.min_call_interval:
-            sleep_time = self.min_call_interval - time_since_last
-            time.sleep(sleep_time)
-        self.last_api_call = time.time()
+        """Wait for a WordPress API token (shared across sync worker threads)"""
+        self.buckets['wp'].take()
+    
+    def _on_wordpress_response(self, response, *args, **kwargs):
+        """Session response hook: back off the WordPress bucket on rate-limit answers"""
+        if response.status_code == 429:
+            print("⚠️  WordPress rate limit hit, slowing down API calls")
+            self.buckets['wp'].penalize()
     
     def _calculate_distance(self, lat1, lon1, lat2, lon2):
         """Calculate distance between two points using Haversine formula (returns miles)"""
+        return self._haversine_miles(self._haversine_a(lat1, lon1, lat2, lon2))
+    
+    def _haversine_a(self, lat1, lon1, lat2, lon2):
+        """Haversine 'a' term between two points; increases with distance, infinity for invalid coordinates"""
         try:
             # Convert to radians
             lat1, lon1, lat2, lon2 = map(math.radians, [lat1, lon1, lat2, lon2])
@@ -104,13 +442,30 @@ class WordPressSyncer:
             # Haversine formula
             dlat = lat2 - lat1
             dlon = lon2 - lon1
-            a = math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+            return math.sin(dlat/2)**2 + math.cos(lat1) * math.cos(lat2) * math.sin(dlon/2)**2
+        except (ValueError, TypeError):
+            return float('inf')
+    
+    def _position(self, lat, lon):
+        """(lat, lon) in radians plus cos(lat), the per-point part of the haversine formula"""
+        lat_rad = math.radians(lat)
+        return lat_rad, math.radians(lon), math.cos(lat_rad)
+    
+    def _haversine_a_between(self, position1, position2, max_dlat=math.inf):
+        """Haversine 'a' term between two _position tuples; infinity once the latitudes alone differ by more than max_dlat"""
+        lat1, lon1, cos_lat1 = position1
+        lat2, lon2, cos_lat2 = position2
+        dlat = lat2 - lat1
+        # a is at least sin²(dlat/2), so a pair outside the latitude band is rejected without any trig
+        if abs(dlat) > max_dlat:
+            return math.inf
+        return math.sin(dlat/2)**2 + cos_lat1 * cos_lat2 * math.sin((lon2 - lon1)/2)**2
+    
+    def _haversine_miles(self, a):
+        """Convert a haversine 'a' term to miles"""
+        try:
             c = 2 * math.asin(math.sqrt(a))
-            
-            # Earth's radius in miles
-            r = 3959
-            
-            return c * r
+            return c * EARTH_RADIUS_MILES
         except (ValueError, TypeError):
             return float('inf')  # Return infinity for invalid coordinates
     
@@ -152,119 +507,195 @@ class WordPressSyncer:
     
     def _get_cached_sheet_data(self, worksheet_name):
         """Get sheet data with caching to reduce API calls"""
-        if worksheet_name in self.sheet_cache:
-            return self.sheet_cache[worksheet_name]
-        
-        self._rate_limit()
-        try:
-            worksheet = self.sheet.worksheet(worksheet_name)
-            records = worksheet.get_all_records()
-            self.sheet_cache[worksheet_name] = records
+        records = self.sheet_cache.get(worksheet_name)
+        if records is not None:
             return records
-        except Exception as e:
-            if "429" in str(e) or "quota exceeded" in str(e).lower():
-                print(f"⚠️  Rate limit hit while loading {worksheet_name}. Waiting 60 seconds...")
-                time.sleep(60)
-                # Retry once after waiting
-                self._rate_limit()
-                worksheet = self.sheet.worksheet(worksheet_name)
-                records = worksheet.get_all_records()
-                self.sheet_cache[worksheet_name] = records
-                return records
-            else:
-                raise
+        
+        # Sync workers can miss at the same time; only one of them fetches the sheet
+        with self._sheet_cache_lock:
+            if worksheet_name not in self.sheet_cache:
+                self.sheet_cache[worksheet_name] = self._fetch_worksheet_records(worksheet_name)
+            return self.sheet_cache[worksheet_name]
+    
+    @with_sheets_backoff
+    def _fetch_worksheet_records(self, worksheet_name):
+        """Fetch all records from a worksheet (retried on Sheets rate limits)"""
+        # One values.get for header + data; worksheet() would first fetch the spreadsheet metadata
+        response = self.sheet.values_get(absolute_range_name(worksheet_name))
+        return _rows_to_records(response.get('values', []))
+    
+    @with_sheets_backoff
+    def _fetch_worksheets_batch(self, worksheet_names):
+        """Fetch records for several worksheets in one values.batchGet request (retried on Sheets rate limits)"""
+        response = self.sheet.values_batch_get([absolute_range_name(name) for name in worksheet_names])
+        value_ranges = response.get('valueRanges', [])
+        # Value ranges come back in request order; an empty sheet has no 'values' key
+        return {
+            name: _rows_to_records(value_range.get('values', []))
+            for name, value_range in zip(worksheet_names, value_ranges)
+        }
     
     def clear_cache(self):
         """Clear the sheet cache to force fresh data"""
-        self.sheet_cache.clear()
+        with self._sheet_cache_lock:
+            self.sheet_cache.clear()
+        self.city_to_hab_samples = None
+        self.beach_to_hab_samples = None
+        self.location_by_beach = None
+        self.status_by_region_type = None
+        self.status_by_type = None
+        self.status_by_type_city = None
+        self._sync_memo.clear()
         print("🗑️  Sheet cache cleared")
     
     def _find_related_post_ids(self, region_name, post_type):
         """Find post IDs for related posts (beaches/cities in a region)"""
         try:
-            # Get the beach_status data to find related posts
-            beach_status_records = self._get_cached_sheet_data('beach_status')
+            if self.status_by_region_type is None:
+                self._build_sheet_indexes()
             
             related_ids = []
-            for record in beach_status_records:
-                record_region = record.get('region', '')
-                record_type = record.get('location_type', '').lower()
-                
-                # Match region and post type
-                if record_region == region_name and record_type == post_type:
-                    # Try to find the WordPress post ID for this location
-                    location_name = record.get('location_name', '')
-                    if location_name:
-                        # Search for existing post
-                        search_slug = f"{location_name.lower().replace(' ', '-')}-red-tide"
-                        existing_post = self.find_existing_post(search_slug, post_type)
-                        if existing_post:
-                            related_ids.append(existing_post['id'])
+            for record in self.status_by_region_type.get((region_name, post_type), []):
+                # Try to find the WordPress post ID for this location
+                location_name = record.get('location_name', '')
+                if location_name:
+                    # Search for existing post
+                    search_slug = _search_slug(location_name)
+                    existing_post = self.find_existing_post(search_slug, post_type)
+                    if existing_post:
+                        related_ids.append(existing_post['id'])
             
             return related_ids
             
         except Exception as e:
-            print(f"   Warning: Could not find related post IDs for {region_name}: {e}")
+            log.warning("   Warning: Could not find related post IDs for %s: %s", region_name, e)
             return []
     
     def _preload_sheet_data(self):
         """Preload all required sheet data to minimize API calls during processing"""
         print("📥 Preloading Google Sheets data...")
         try:
-            # Load all required worksheets
+            # Load all required worksheets with a single batchGet request
             required_sheets = ['beach_status', 'locations', 'sample_mapping']
-            for sheet_name in required_sheets:
-                print(f"   Loading {sheet_name}...")
-                self._get_cached_sheet_data(sheet_name)
+            with self._sheet_cache_lock:
+                missing_sheets = [name for name in required_sheets if name not in self.sheet_cache]
+                if missing_sheets:
+                    print(f"   Loading {', '.join(missing_sheets)}...")
+                    self.sheet_cache.update(self._fetch_worksheets_batch(missing_sheets))
             
             # Build lookup structures for efficient child post finding
+            self._build_sheet_indexes()
             self._build_child_post_lookups()
+            self._build_hab_site_lookups()
             
             print("✅ All sheet data preloaded successfully")
         except Exception as e:
             print(f"⚠️  Warning: Could not preload all sheet data: {e}")
             print("   Will load data as needed during processing")
     
+    def _build_sheet_indexes(self):
+        """Index locations by beach and beach_status by location_type, (region, type) and (type, city) in one pass each"""
+        location_by_beach = {}
+        for record in self._get_cached_sheet_data('locations'):
+            # Keep the first row per beach, matching the old linear scan
+            location_by_beach.setdefault(record.get('beach', ''), record)
+        
+        status_by_region_type = {}
+        status_by_type = {}
+        status_by_type_city = {}
+        for record in self._get_cached_sheet_data('beach_status'):
+            # Lowercase location_type once here instead of in every nearby-* scan
+            location_type = record.get('location_type', '').lower()
+            status_by_region_type.setdefault((record.get('region', ''), location_type), []).append(record)
+            status_by_type.setdefault(location_type, []).append(record)
+            status_by_type_city.setdefault((location_type, record.get('city', '')), []).append(record)
+        
+        self.location_by_beach = location_by_beach
+        self.status_by_region_type = status_by_region_type
+        self.status_by_type = status_by_type
+        self.status_by_type_city = status_by_type_city
+    
+    def _status_records(self, location_type, region_name=None, city_name=None):
+        """beach_status rows of one location_type, optionally narrowed to a region or city, in sheet order"""
+        if self.status_by_type is None:
+            self._build_sheet_indexes()
+        if region_name is not None:
+            return self.status_by_region_type.get((region_name, location_type), [])
+        if city_name is not None:
+            return self.status_by_type_city.get((location_type, city_name), [])
+        return self.status_by_type.get(location_type, [])
+    
+    @memoize_per_sync
+    def _latest_status_by_name(self, location_type, region_name=None):
+        """location_name -> last beach_status row of a type (optionally in one region)"""
+        return {record.get('location_name', ''): record
+                for record in self._status_records(location_type, region_name)}
+    
+    @memoize_per_sync
+    def _first_status_by_name(self, location_type):
+        """location_name -> current_status of the first beach_status row of a type"""
+        statuses = {}
+        for record in self._status_records(location_type):
+            statuses.setdefault(record.get('location_name', ''), record.get('current_status', 'no_data'))
+        return statuses
+    
+    def _beach_coordinates(self, beach_name):
+        """(lat, lon) from the first locations row for a beach, or (None, None)"""
+        if self.location_by_beach is None:
+            self._build_sheet_indexes()
+        record = self.location_by_beach.get(beach_name)
+        if record is None:
+            return None, None
+        return self._extract_coordinates_from_record(record)
+    
+    @memoize_per_sync
+    def _beach_position(self, beach_name):
+        """Radians and cos(lat) of a beach's coordinates, once per sync; None without coordinates"""
+        lat, lon = self._beach_coordinates(beach_name)
+        if lat is None or lon is None:
+            return None
+        return self._position(lat, lon)
+    
     def _build_child_post_lookups(self):
         """Build lookup structures to efficiently find child posts without repeated loops"""
         print("🔍 Building child post lookup structures...")
         
         try:
-            # Get all beach status records
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            
             # Build region -> beaches lookup
             self.region_to_beaches = {}
             self.region_to_cities = {}
             self.city_to_beaches = {}
             
-            # Single pass through all records to build lookups
-            for record in beach_status_records:
+            # One pass over the beach rows (already grouped by type in _build_sheet_indexes)
+            for record in self._status_records('beach'):
                 location_name = record.get('location_name', '')
-                location_type = record.get('location_type', '').lower()
                 region = record.get('region', '')
                 city = record.get('city', '')
                 
                 if not location_name or not region:
                     continue
                 
-                # Build region -> beaches lookup
-                if location_type == 'beach':
-                    if region not in self.region_to_beaches:
-                        self.region_to_beaches[region] = set()  # Use set to avoid duplicates
-                    self.region_to_beaches[region].add(location_name)
-                    
-                    # Also build city -> beaches lookup
-                    if city:
-                        if city not in self.city_to_beaches:
-                            self.city_to_beaches[city] = set()  # Use set to avoid duplicates
-                        self.city_to_beaches[city].add(location_name)
+                self.region_to_beaches.setdefault(region, set()).add(location_name)  # Use set to avoid duplicates
+                
+                # Also build city -> beaches lookup
+                if city:
+                    self.city_to_beaches.setdefault(city, set()).add(location_name)
+            
+            # Build region -> cities lookup from the city rows
+            for record in self._status_records('city'):
+                location_name = record.get('location_name', '')
+                region = record.get('region', '')
                 
-                # Build region -> cities lookup
-                elif location_type == 'city':
-                    if region not in self.region_to_cities:
-                        self.region_to_cities[region] = set()  # Use set to avoid duplicates
-                    self.region_to_cities[region].add(location_name)
+                if not location_name or not region:
+                    continue
+                
+                self.region_to_cities.setdefault(region, set()).add(location_name)
+            
+            # Keep sorted lists rather than sets: set order follows per-process string hashing, and these
+            # names become child/nearby lists in post payloads whose hash must be the same every run
+            for lookup in (self.region_to_beaches, self.region_to_cities, self.city_to_beaches):
+                for key, names in lookup.items():
+                    lookup[key] = sorted(names)
             
             # Pre-fetch WordPress post IDs for all locations to avoid repeated API calls
             self._prefetch_wordpress_post_ids()
@@ -303,12 +734,12 @@ class WordPressSyncer:
             
             # Pre-fetch beach post IDs
             if self.region_to_beaches:
-                beach_names = list(set([beach for beaches in self.region_to_beaches.values() for beach in beaches]))
+                beach_names = sorted({beach for beaches in self.region_to_beaches.values() for beach in beaches})
                 self._prefetch_post_ids_by_type(beach_names, 'beach')
             
             # Pre-fetch city post IDs
             if self.region_to_cities:
-                city_names = list(set([city for cities in self.region_to_cities.values() for city in cities]))
+                city_names = sorted({city for cities in self.region_to_cities.values() for city in cities})
                 self._prefetch_post_ids_by_type(city_names, 'city')
             
             # Pre-fetch region post IDs
@@ -324,21 +755,14 @@ class WordPressSyncer:
     def _prefetch_post_ids_by_type(self, location_names, post_type):
         """Pre-fetch post IDs for a specific post type"""
         try:
-            # Map post types to REST endpoints
-            rest_endpoints = {
-                'beach': 'beaches',
-                'city': 'cities',
-                'region': 'regions'
-            }
-            
-            rest_base = rest_endpoints.get(post_type, post_type)
+            rest_base = self.rest_endpoints.get(post_type, post_type)
             
             # Get all posts of this type from WordPress
             search_url = f"{self.wp_site_url}/wp-json/wp/v2/{rest_base}"
-            params = {'per_page': 100}  # Get more posts to search through
+            params = {'per_page': 100, '_fields': 'id,slug,title'}  # Get more posts to search through
             
             self._rate_limit()
-            response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
+            response = self.http.get(search_url, params=params, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 posts = response.json()
@@ -364,20 +788,24 @@ class WordPressSyncer:
         except Exception as e:
             print(f"         ⚠️  Error pre-fetching {post_type} post IDs: {e}")
     
+    def _child_names(self, parent_name, child_type):
+        """Names of the beaches or cities under a region/city, from the pre-built lookups"""
+        if child_type == 'beach':
+            # Check both region and city mappings; a beach may appear in both, so dedupe in a stable order
+            beach_names = self.region_to_beaches.get(parent_name, []) + self.city_to_beaches.get(parent_name, [])
+            return sorted(set(beach_names))
+        if child_type == 'city':
+            return self.region_to_cities.get(parent_name, [])
+        return []
+    
     def _find_child_post_ids_optimized(self, parent_name, child_type):
         """Optimized version of _find_child_post_ids using pre-built lookups"""
         try:
             if child_type == 'beach':
-                # Use pre-built lookup - check both region and city mappings
-                beach_names = []
-                if parent_name in self.region_to_beaches:
-                    beach_names.extend(self.region_to_beaches[parent_name])
-                if parent_name in self.city_to_beaches:
-                    beach_names.extend(self.city_to_beaches[parent_name])
+                # Use pre-built lookup
+                beach_names = self._child_names(parent_name, 'beach')
                 
                 if beach_names:
-                    # Remove duplicates (in case a beach appears in both mappings)
-                    beach_names = list(set(beach_names))
                     child_ids = []
                     
                     for beach_name in beach_names:
@@ -396,8 +824,8 @@ class WordPressSyncer:
                     
             elif child_type == 'city':
                 # Use pre-built lookup
-                if parent_name in self.region_to_cities:
-                    city_names = list(self.region_to_cities[parent_name])  # Convert set to list
+                city_names = self._child_names(parent_name, 'city')
+                if city_names:
                     child_ids = []
                     
                     for city_name in city_names:
@@ -440,7 +868,7 @@ class WordPressSyncer:
         try:
             # Test basic auth
             test_url = f"{self.wp_site_url}/wp-json/wp/v2/users/me"
-            response = requests.get(test_url, auth=self.auth, timeout=10)
+            response = self.http.get(test_url, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 user_data = response.json()
@@ -449,31 +877,26 @@ class WordPressSyncer:
                 print(f"❌ WordPress auth failed: {response.status_code} - {response.text}")
                 raise Exception("WordPress authentication failed")
             
-            # Test REST API endpoints for our post types
-            print("\n🔍 Checking REST API endpoints...")
-            endpoints_to_test = ['beaches', 'cities', 'regions']
-            
-            for endpoint in endpoints_to_test:
-                test_endpoint_url = f"{self.wp_site_url}/wp-json/wp/v2/{endpoint}"
-                endpoint_response = requests.get(test_endpoint_url, auth=self.auth, timeout=10)
-                
-                if endpoint_response.status_code == 200:
-                    print(f"   ✅ /{endpoint} endpoint available")
-                elif endpoint_response.status_code == 404:
-                    print(f"   ❌ /{endpoint} endpoint not found (404)")
-                else:
-                    print(f"   ⚠️  /{endpoint} endpoint returned {endpoint_response.status_code}")
-            
-            # List all available post types
+            # List all available post types; /types also tells us each of our endpoints
             print("\n📋 Available post types in REST API:")
             try:
                 types_url = f"{self.wp_site_url}/wp-json/wp/v2/types"
-                types_response = requests.get(types_url, auth=self.auth, timeout=10)
+                types_response = self.http.get(types_url, timeout=self.request_timeout)
                 if types_response.status_code == 200:
                     types_data = types_response.json()
                     for type_key, type_info in types_data.items():
                         rest_base = type_info.get('rest_base', 'N/A')
                         print(f"   - {type_key}: /wp-json/wp/v2/{rest_base}")
+                    
+                    # Check our post types from the same response instead of probing each endpoint
+                    print("\n🔍 Checking REST API endpoints...")
+                    for post_type in self.rest_endpoints:
+                        rest_base = types_data.get(post_type, {}).get('rest_base')
+                        if rest_base:
+                            self.rest_endpoints[post_type] = rest_base
+                            print(f"   ✅ /{rest_base} endpoint available")
+                        else:
+                            print(f"   ❌ {post_type} post type not exposed in the REST API")
                 else:
                     print("   Could not fetch post types list")
             except Exception as e:
@@ -489,26 +912,26 @@ class WordPressSyncer:
             return self._generate_mock_data()
             
         try:
-            records = self._get_cached_sheet_data('beach_status')
-            
             # Group by location name and type, keeping only the most recent record for each
             data_by_type = {'beach': [], 'city': [], 'region': []}
-            latest_records = {}  # Key: (location_name, location_type), Value: record
+            latest_records = {}  # Key: (location_name, location_type), Value: (last_updated, record)
             
-            for record in records:
-                location_name = record.get('location_name', '')
-                location_type = record.get('location_type', '').lower()
-                last_updated = record.get('last_updated', '')
-                
-                if location_type in data_by_type and location_name:
+            # Rows come pre-grouped by lowercased type, in sheet order within each type
+            for location_type in data_by_type:
+                for record in self._status_records(location_type):
+                    location_name = record.get('location_name', '')
+                    if not location_name:
+                        continue
+                    last_updated = record.get('last_updated', '')
                     key = (location_name, location_type)
                     
-                    # Keep the most recent record for each location
-                    if key not in latest_records or last_updated > latest_records[key].get('last_updated', ''):
-                        latest_records[key] = record
+                    # Keep the most recent record for each location (one dict probe per row)
+                    current = latest_records.get(key)
+                    if current is None or last_updated > current[0]:
+                        latest_records[key] = (last_updated, record)
             
-            # Convert back to lists organized by type
-            for (location_name, location_type), record in latest_records.items():
+            # Convert back to lists organized by type (first-seen order, which TEST_LIMIT relies on)
+            for (location_name, location_type), (_, record) in latest_records.items():
                 data_by_type[location_type].append(record)
             
             # Apply test mode limits
@@ -548,30 +971,7 @@ class WordPressSyncer:
             return data_by_type
             
         except Exception as e:
-            error_msg = str(e)
-            if "header row in the worksheet is not unique" in error_msg:
-                print(f"❌ Failed to load sheet data: {e}")
-                print("\n🔧 HEADER ISSUE DETECTED!")
-                print("   Your Google Sheet has duplicate column headers.")
-                print("   This usually happens when new columns are added incorrectly.")
-                print("\n📋 REQUIRED HEADERS (in exact order):")
-                required_headers = [
-                    'location_name', 'location_type', 'date', 'current_status',
-                    'peak_count', 'avg_count', 'confidence_score', 'sample_date', 'last_updated',
-                    'region', 'city', 'slug', 'beach_count', 'city_count', 
-                    'beaches_safe', 'beaches_caution', 'beaches_avoid'
-                ]
-                for i, header in enumerate(required_headers, 1):
-                    print(f"   {i:2d}. {header}")
-                print("\n🔧 MANUAL FIX:")
-                print("   1. Open your Google Sheet (beach_status worksheet)")
-                print("   2. Delete the current header row")
-                print("   3. Add a new header row with the exact headers above")
-                print("   4. Ensure NO duplicate column names exist")
-                print("   5. Make sure 'slug' column exists (not 'page slug')")
-                print("\n💡 Or run: python fix_sheet_headers.py for automated fix")
-            else:
-                print(f"❌ Failed to load sheet data: {e}")
+            print(f"❌ Failed to load sheet data: {e}")
             raise
     
     def _generate_mock_data(self):
@@ -663,26 +1063,30 @@ class WordPressSyncer:
     
     def find_existing_post(self, slug, post_type):
         """Find existing WordPress post by slug"""
+        # Answer from the in-memory index when possible (None marks a slug known to be missing)
+        if (post_type, slug) in self.post_index:
+            post_id = self.post_index[(post_type, slug)]
+            return {'id': post_id, 'slug': slug} if post_id else None
+        if post_type in self.indexed_post_types:
+            # The listing covered every published post of this type, so a miss means it doesn't exist yet
+            return None
+        
         # Rate limit WordPress API calls
         self._rate_limit()
         
-        # Map post types to REST endpoints
-        rest_endpoints = {
-            'beach': 'beaches',
-            'city': 'cities', 
-            'region': 'regions'
-        }
-        
-        rest_base = rest_endpoints.get(post_type, post_type)
+        rest_base = self.rest_endpoints.get(post_type, post_type)
         
         try:
             search_url = f"{self.wp_site_url}/wp-json/wp/v2/{rest_base}"
-            params = {'slug': slug}
+            # Callers only need the ID; _fields trims the full post JSON down to a few bytes
+            params = {'slug': slug, '_fields': 'id,slug'}
             
-            response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
+            response = self.http.get(search_url, params=params, timeout=self.request_timeout)
             
             if response.status_code == 200:
                 posts = response.json()
+                if posts:
+                    self.post_index[(post_type, slug)] = posts[0]['id']
                 return posts[0] if posts else None
             else:
                 print(f"   Warning: Search failed for {slug}: {response.status_code}")
@@ -692,37 +1096,113 @@ class WordPressSyncer:
             print(f"   Warning: Could not search for existing post {slug}: {e}")
             return None
     
-    def create_or_update_post(self, data, post_type):
-        """Create or update a WordPress post"""
-        # Rate limit WordPress API calls too
-        self._rate_limit()
+    def _prefetch_existing_posts(self, post_type, slugs):
+        """Resolve many slugs with comma-separated ?slug= queries (100 per request) into post_index"""
+        rest_base = self.rest_endpoints.get(post_type, post_type)
+        search_url = f"{self.wp_site_url}/wp-json/wp/v2/{rest_base}"
         
-        # Map post types to REST endpoints
-        rest_endpoints = {
-            'beach': 'beaches',
-            'city': 'cities',
-            'region': 'regions'
-        }
+        pending = [slug for slug in dict.fromkeys(slugs) if (post_type, slug) not in self.post_index]
+        for start in range(0, len(pending), 100):
+            chunk = pending[start:start + 100]
+            self._rate_limit()
+            try:
+                params = {'slug': ','.join(chunk), 'per_page': 100, '_fields': 'id,slug,meta._syncer_hash'}
+                response = self.http.get(search_url, params=params, timeout=self.request_timeout)
+                if response.status_code != 200:
+                    print(f"   ⚠️  Could not look up {post_type} slugs: {response.status_code}")
+                    continue
+                
+                posts = response.json()
+                found = {post['slug']: post['id'] for post in posts}
+                for slug in chunk:
+                    self.post_index[(post_type, slug)] = found.get(slug)
+                
+                # Keep the stored payload hashes so unchanged posts can still be skipped
+                hashes = self.existing_hashes.setdefault(post_type, {})
+                for post in posts:
+                    meta = post.get('meta')
+                    if isinstance(meta, dict) and meta.get('_syncer_hash'):
+                        hashes[post['slug']] = meta['_syncer_hash']
+                    
+            except Exception as e:
+                print(f"   ⚠️  Could not look up {post_type} slugs: {e}")
+    
+    def _load_existing_ids(self, post_type):
+        """Fetch slug -> post ID for every published post of a type via paginated listing"""
+        rest_base = self.rest_endpoints.get(post_type, post_type)
+        search_url = f"{self.wp_site_url}/wp-json/wp/v2/{rest_base}"
         
-        rest_base = rest_endpoints.get(post_type, post_type)
-        location_name = data['location_name']
+        existing_ids = {}
+        existing_hashes = {}
+        page = 1
+        try:
+            while True:
+                self._rate_limit()
+                params = {'per_page': 100, 'page': page, '_fields': 'id,slug,meta._syncer_hash'}
+                response = self.http.get(search_url, params=params, timeout=self.request_timeout)
+                
+                # WordPress answers 400 once the page number is past the last page
+                if response.status_code == 400 and page > 1:
+                    break
+                if response.status_code != 200:
+                    print(f"   ⚠️  Could not list existing {post_type} posts: {response.status_code}")
+                    return None
+                
+                posts = response.json()
+                for post in posts:
+                    existing_ids[post['slug']] = post['id']
+                    # meta is a list rather than a dict when no meta keys are registered for REST
+                    meta = post.get('meta')
+                    if isinstance(meta, dict) and meta.get('_syncer_hash'):
+                        existing_hashes[post['slug']] = meta['_syncer_hash']
+                
+                total_pages = int(response.headers.get('X-WP-TotalPages', page))
+                if not posts or page >= total_pages:
+                    break
+                page += 1
+                
+        except Exception as e:
+            print(f"   ⚠️  Could not list existing {post_type} posts: {e}")
+            return None
+        
+        self.existing_hashes[post_type] = existing_hashes
+        for slug, post_id in existing_ids.items():
+            self.post_index[(post_type, slug)] = post_id
+        self.indexed_post_types.add(post_type)
+        print(f"   📋 Found {len(existing_ids)} existing {post_type} posts")
+        return existing_ids
+    
+    def _target_slug(self, data):
+        """Final WordPress slug for a sheet record"""
         slug = data['slug']
         
         # In test mode, add prefix to avoid conflicts
         if self.test_mode or self.wordpress_test_only:
             slug = f"test-{slug}"
-            print(f"   🧪 Test mode: Using slug '{slug}' to avoid conflicts")
+            log.debug("   🧪 Test mode: Using slug '%s' to avoid conflicts", slug)
         
         # Ensure slug format is consistent
         if not slug.endswith('-red-tide'):
             slug = f"{slug}-red-tide"
         
+        return slug
+    
+    def create_or_update_post(self, data, post_type, existing_ids=None):
+        """Create or update a WordPress post (existing_ids: optional slug -> ID map from _load_existing_ids)"""
+        rest_base = self.rest_endpoints.get(post_type, post_type)
+        location_name = data['location_name']
+        slug = self._target_slug(data)
+        
         # Check for existing post
-        existing_post = self.find_existing_post(slug, post_type)
+        if existing_ids is not None:
+            existing_id = existing_ids.get(slug)
+        else:
+            existing_post = self.find_existing_post(slug, post_type)
+            existing_id = existing_post['id'] if existing_post else None
         
-        if existing_post:
+        if existing_id:
             # Update existing post
-            post_id = existing_post['id']
+            post_id = existing_id
             url = f"{self.wp_site_url}/wp-json/wp/v2/{rest_base}/{post_id}"
             method = 'POST'  # WordPress uses POST for updates
             action = "Updating"
@@ -732,205 +1212,111 @@ class WordPressSyncer:
             method = 'POST'
             action = "Creating"
         
-        print(f"   {action} {post_type}: {location_name} (endpoint: {rest_base})")
+        # Prepare post data with the final (possibly test-prefixed) slug
+        post_data = self._prepare_post_data(data, post_type, slug_override=slug)
+        if self._has_unresolved_links(post_type, data, post_data['acf']):
+            # Some related post doesn't exist yet; _sync_deferred_relinks checks again after the last stage
+            self._deferred_relinks.append((post_type, data, post_data['acf']))
         
-        # Prepare post data (update slug in data for title generation)
-        data_copy = data.copy()
-        data_copy['slug'] = slug
-        post_data = self._prepare_post_data(data_copy, post_type)
+        # The hash meta is only sent when skipping is enabled; it needs server-side registration
+        payload_hash = None
+        if self.skip_unchanged:
+            payload_hash = _payload_hash(post_data)
+            if existing_id and self.existing_hashes.get(post_type, {}).get(slug) == payload_hash:
+                log.info("   ⏭️  Unchanged %s: %s (ID: %s)", post_type, location_name, existing_id)
+                return existing_id
+            post_data['meta']['_syncer_hash'] = payload_hash
+        
+        log.info("   %s %s: %s (endpoint: %s)", action, post_type, location_name, rest_base)
+        
+        # Rate limit WordPress API calls too
+        self._rate_limit()
         
         try:
-            response = requests.request(
+            # Serialize compactly ourselves; requests' json= adds a space after every separator
+            body = json.dumps(post_data, separators=(',', ':'), allow_nan=False).encode('utf-8')
+            response = self.http.request(
                 method, url,
-                json=post_data,
-                auth=self.auth,
+                data=body,
                 headers={'Content-Type': 'application/json'},
-                timeout=15
+                timeout=self.request_timeout
             )
             
             if response.status_code in [200, 201]:
                 result = response.json()
-                print(f"   ✅ Success: {location_name} (ID: {result['id']})")
+                log.info("   ✅ Success: %s (ID: %s)", location_name, result['id'])
+                if existing_ids is not None:
+                    existing_ids[slug] = result['id']
+                self.post_index[(post_type, slug)] = result['id']
+                self.location_to_post_id.setdefault(post_type, {})[location_name] = result['id']
+                if payload_hash:
+                    self.existing_hashes.setdefault(post_type, {})[slug] = payload_hash
                 return result['id']
             else:
-                print(f"   ❌ Failed: {location_name} - {response.status_code}")
-                print(f"      Error: {response.text[:200]}")
-                print(f"      URL attempted: {url}")
+                log.error("   ❌ Failed: %s - %s", location_name, response.status_code)
+                log.error("      Error: %s", response.text[:200])
+                log.error("      URL attempted: %s", url)
                 return None
                 
         except Exception as e:
-            print(f"   ❌ Error creating/updating {location_name}: {e}")
+            log.error("   ❌ Error creating/updating %s: %s", location_name, e)
             return None
     
-    def _prepare_post_data(self, data, post_type):
+    def _has_unresolved_links(self, post_type, data, acf):
+        """True when a parent, child or nearby link in an ACF payload has no post ID yet"""
+        if post_type == 'beach':
+            parents = ((data.get('city'), acf['parent_city_post']), (data.get('region'), acf['parent_region_post']))
+        elif post_type == 'city':
+            parents = ((data.get('region'), acf['parent_region']),)
+        else:
+            parents = ()
+        if any(name and not post_id for name, post_id in parents):
+            return True
+        
+        # Child lists come back shorter than the sheet's list while some children have no post
+        if hasattr(self, 'region_to_beaches') and self.region_to_beaches:
+            for field, child_type in (('child_beaches', 'beach'), ('child_cities', 'city')):
+                if field in acf and len(acf[field]) < len(self._child_names(data['location_name'], child_type)):
+                    return True
+        
+        # Nearby entries keep a None post ID for locations without a post
+        for field, id_key in (('nearby_beaches', 'beach'), ('nearby_cities', 'city'), ('nearby_regions', 'region')):
+            if any(entry.get(id_key) is None for entry in acf.get(field) or ()):
+                return True
+        return False
+    
+    def _prepare_post_data(self, data, post_type, slug_override=None):
         """Prepare WordPress post data with ACF fields"""
         location_name = data['location_name']
         current_status = data['current_status']
+        slug = slug_override or data['slug']
+        region = data.get('region', '')
         
-        # Generate title and meta description
-        if post_type == 'beach':
-            title = f"{location_name} Red Tide Status - Current Conditions & Updates"
-            meta_desc = f"Current red tide conditions at {location_name}. Real-time HAB monitoring data, safety information, and beach status updates."
-        elif post_type == 'city':
-            title = f"{location_name} Red Tide Status - All Beaches Current Conditions"
-            meta_desc = f"Red tide conditions for all beaches in {location_name}, FL. Current status, safety advisories, and detailed monitoring data."
-        else:  # region
-            title = f"{location_name} Red Tide Status - Regional Overview & Beach Conditions"
-            meta_desc = f"Comprehensive red tide monitoring for {location_name}. Track conditions across all beaches and cities in the region."
+        # Generate title and meta description (anything that isn't a beach or city is a region)
+        title_template, meta_template = POST_TEMPLATES.get(post_type, POST_TEMPLATES['region'])
+        title = title_template.format(name=location_name)
+        meta_desc = meta_template.format(name=location_name)
         
         # Core ACF fields (all post types)
-        acf_data = {
+        core_fields = {
             'location_name': location_name,
             'current_status': current_status,
             'status_color': self.get_status_color(current_status),
-            'last_updated': datetime.now(pytz.timezone('US/Eastern')).strftime('%Y-%m-%d %H:%M:%S'),
-            'url_slug': data['slug'],
-            'region': data.get('region', '') or None,
-            'state': 'FL',
-            'featured_location': False
+            'last_updated': self._run_timestamp,
+            'url_slug': slug,
+            'region': region or None
         }
         
         # Add type-specific ACF fields
-        if post_type == 'beach':
-            # Load additional beach data from locations sheet
-            beach_location_data = self._get_beach_location_data(location_name)
-            
-            # Get HAB sampling sites for this beach
-            beach_sampling_sites = self._get_beach_sampling_sites(location_name)
-            
-            # Get parent city and region post IDs
-            parent_city_id = self._find_parent_post_id(data.get('city', ''), 'city')
-            parent_region_id = self._find_parent_post_id(data.get('region', ''), 'region')
-            
-            acf_data.update({
-                'city': data.get('city', '') or None,
-                'coordinates': beach_location_data.get('coordinates', '') or None,
-                'full_address': beach_location_data.get('address', '') or None,
-                'zip_code': beach_location_data.get('zip', '') or None,
-                'peak_count': int(data.get('peak_count', 0)),
-                'confidence_score': int(data.get('confidence_score', 0)),
-                'sample_date': data.get('sample_date', '') or None,
-                'parent_city_post': parent_city_id,
-                'parent_region_post': parent_region_id,
-                'sampling_sites': beach_sampling_sites,
-                'beach_description': self._generate_beach_description(location_name, data),
-                'nearby_beaches': self._get_nearby_beaches(location_name, data.get('region', '')),
-                'nearby_regions': self._get_nearby_regions(data.get('region', ''))
-            })
-            
-            # Debug: Print beach ACF data including coordinates
-            print(f"   🔍 Beach ACF data for {location_name}:")
-            coordinates = acf_data.get('coordinates', 'N/A')
-            if coordinates and isinstance(coordinates, dict):
-                print(f"      - coordinates: Google Maps format - lat: {coordinates.get('lat', 'N/A')}, lng: {coordinates.get('lng', 'N/A')}, zoom: {coordinates.get('zoom', 'N/A')}")
-            else:
-                print(f"      - coordinates: {coordinates}")
-            print(f"      - full_address: {acf_data.get('full_address', 'N/A')}")
-            print(f"      - zip_code: {acf_data.get('zip_code', 'N/A')}")
-            print(f"      - peak_count: {acf_data.get('peak_count', 'N/A')}")
-            print(f"      - confidence_score: {acf_data.get('confidence_score', 'N/A')}")
-            print(f"      - sample_date: {acf_data.get('sample_date', 'N/A')}")
-            
-        elif post_type == 'city':
-            # Get HAB sampling sites for this city
-            hab_sites = self._get_city_hab_sampling_sites(location_name)
-            
-            # Get parent region post ID
-            parent_region_id = self._find_parent_post_id(data.get('region', ''), 'region')
-            
-            # Get child beach post IDs
-            child_beach_ids = self._find_child_post_ids(location_name, 'beach')
-            
-            # Handle required child_beaches field - if empty, provide a fallback
-            if not child_beach_ids:
-                print(f"      ⚠️  No child beaches found for {location_name}, providing fallback")
-                # Try to find at least one beach in this city from the locations sheet
-                locations_records = self._get_cached_sheet_data('locations')
-                fallback_beach_id = None
-                for location_record in locations_records:
-                    if location_record.get('city', '') == location_name:
-                        beach_name = location_record.get('beach', '')
-                        if beach_name:
-                            search_slug = f"{beach_name.lower().replace(' ', '-')}-red-tide"
-                            existing_post = self.find_existing_post(search_slug, 'beach')
-                            if existing_post:
-                                fallback_beach_id = existing_post['id']
-                                print(f"      🔧 Using fallback beach: {beach_name} (ID: {fallback_beach_id})")
-                                break
-                
-                if fallback_beach_id:
-                    child_beach_ids = [fallback_beach_id]
-                else:
-                    print(f"      ❌ No fallback beach found, this may cause validation errors")
-            
-            acf_data.update({
-                'beaches_safe': int(data.get('beaches_safe', 0)),
-                'beaches_caution': int(data.get('beaches_caution', 0)),
-                'beaches_avoid': int(data.get('beaches_avoid', 0)),
-                'child_beaches': child_beach_ids,
-                'parent_region': parent_region_id,
-                'peak_cell_count': int(data.get('peak_count', 0)),
-                'average_cell_count': int(data.get('avg_count', 0)),
-                'average_confidence': int(data.get('confidence_score', 0)),
-                'latest_sample_data': data.get('sample_date', '') or None,
-                'total_beaches': int(data.get('beach_count', 0)),
-                'city_description': self._generate_city_description(location_name, data),
-                'nearby_cities': self._get_nearby_cities(location_name, data.get('region', '')),
-                'nearby_beaches': self._get_nearby_beaches_for_city(location_name, data.get('region', ''))
-            })
-            
-            # Debug: Print city ACF data
-            print(f"   🔍 City ACF data for {location_name}:")
-            print(f"      - peak_cell_count: {acf_data.get('peak_cell_count', 'N/A')}")
-            print(f"      - average_cell_count: {acf_data.get('average_cell_count', 'N/A')}")
-            print(f"      - average_confidence: {acf_data.get('average_confidence', 'N/A')}")
-            print(f"      - latest_sample_data: {acf_data.get('latest_sample_data', 'N/A')}")
-            print(f"      - total_beaches: {acf_data.get('total_beaches', 'N/A')}")
-            print(f"      - beaches_safe: {acf_data.get('beaches_safe', 'N/A')}")
-            print(f"      - beaches_caution: {acf_data.get('beaches_caution', 'N/A')}")
-            print(f"      - beaches_avoid: {acf_data.get('beaches_avoid', 'N/A')}")
-            print(f"      - child_beaches (IDs): {child_beach_ids}")
-            print(f"      - parent_region (ID): {parent_region_id}")
-            
-        elif post_type == 'region':
-            # Get child post IDs
-            child_beach_ids = self._find_child_post_ids(location_name, 'beach')
-            child_city_ids = self._find_child_post_ids(location_name, 'city')
-            
-            acf_data.update({
-                'peak_count': int(data.get('peak_count', 0)),
-                'avg_count': int(data.get('avg_count', 0)),
-                'confidence_score': int(data.get('confidence_score', 0)),
-                'sample_date': data.get('sample_date', '') or None,
-                'beach_count': int(data.get('beach_count', 0)),
-                'beaches_safe': int(data.get('beaches_safe', 0)),
-                'beaches_caution': int(data.get('beaches_caution', 0)),
-                'beaches_avoid': int(data.get('beaches_avoid', 0)),
-                'city_count': int(data.get('city_count', 0)),
-                'total_beaches': int(data.get('beach_count', 0)),
-                'total_cities': int(data.get('city_count', 0)),
-                'child_beaches': child_beach_ids,
-                'child_cities': child_city_ids,
-                'region_description': self._generate_region_description(location_name, data),
-                'nearby_regions': self._get_nearby_regions(location_name)
-            })
-            
-            # Debug: Print region ACF data
-            print(f"   🔍 Region ACF data for {location_name}:")
-            print(f"      - beach_count: {acf_data.get('beach_count', 'N/A')}")
-            print(f"      - city_count: {acf_data.get('city_count', 'N/A')}")
-            print(f"      - beaches_safe: {acf_data.get('beaches_safe', 'N/A')}")
-            print(f"      - beaches_caution: {acf_data.get('beaches_caution', 'N/A')}")
-            print(f"      - beaches_avoid: {acf_data.get('beaches_avoid', 'N/A')}")
-            print(f"      - child_beaches (IDs): {child_beach_ids}")
-            print(f"      - child_cities (IDs): {child_city_ids}")
+        build_acf = self._ACF_BUILDERS.get(post_type, self._ACF_BUILDERS['region'])
+        acf = build_acf(self, data, core_fields)
         
         # WordPress post payload
         post_payload = {
             'title': title,
-            'slug': data['slug'],
+            'slug': slug,
             'status': 'publish',
-            'acf': acf_data,
+            'acf': acf.to_dict(),
             'meta': {
                 '_yoast_wpseo_metadesc': meta_desc
             }
@@ -938,6 +1324,169 @@ class WordPressSyncer:
         
         return post_payload
     
+    def _build_beach_acf(self, data, core_fields):
+        """Build beach ACF fields: location details, sampling sites, parents and nearby posts"""
+        location_name = core_fields['location_name']
+        region = data.get('region', '')
+        
+        # Load additional beach data from locations sheet
+        beach_location_data = self._get_beach_location_data(location_name)
+        
+        # Get HAB sampling sites for this beach
+        beach_sampling_sites = self._get_beach_sampling_sites(location_name)
+        
+        # Get parent city and region post IDs
+        parent_city_id = self._find_parent_post_id(data.get('city', ''), 'city')
+        parent_region_id = self._find_parent_post_id(region, 'region')
+        
+        acf = BeachAcf(
+            **core_fields,
+            city=_or_none(data, 'city'),
+            coordinates=_or_none(beach_location_data, 'coordinates'),
+            full_address=_or_none(beach_location_data, 'address'),
+            zip_code=_or_none(beach_location_data, 'zip'),
+            peak_count=_as_int(data, 'peak_count'),
+            confidence_score=_as_int(data, 'confidence_score'),
+            sample_date=_or_none(data, 'sample_date'),
+            parent_city_post=parent_city_id,
+            parent_region_post=parent_region_id,
+            sampling_sites=beach_sampling_sites,
+            beach_description=self._generate_beach_description(location_name, data),
+            nearby_beaches=self._get_nearby_beaches(location_name, region),
+            nearby_regions=self._get_nearby_regions(region)
+        )
+        
+        # Debug: Log beach ACF data including coordinates
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   🔍 Beach ACF data for %s:", location_name)
+            coordinates = acf.coordinates
+            if coordinates and isinstance(coordinates, dict):
+                log.debug("      - coordinates: Google Maps format - lat: %s, lng: %s, zoom: %s",
+                          coordinates.get('lat', 'N/A'), coordinates.get('lng', 'N/A'), coordinates.get('zoom', 'N/A'))
+            else:
+                log.debug("      - coordinates: %s", coordinates)
+            log.debug("      - full_address: %s", acf.full_address)
+            log.debug("      - zip_code: %s", acf.zip_code)
+            log.debug("      - peak_count: %s", acf.peak_count)
+            log.debug("      - confidence_score: %s", acf.confidence_score)
+            log.debug("      - sample_date: %s", acf.sample_date)
+        
+        return acf
+    
+    def _build_city_acf(self, data, core_fields):
+        """Build city ACF fields: HAB sites, child beaches, parent region and nearby posts"""
+        location_name = core_fields['location_name']
+        region = data.get('region', '')
+        
+        # Get HAB sampling sites for this city
+        hab_sites = self._get_city_hab_sampling_sites(location_name)
+        
+        # Get parent region post ID
+        parent_region_id = self._find_parent_post_id(region, 'region')
+        
+        # Get child beach post IDs
+        child_beach_ids = self._find_child_post_ids(location_name, 'beach')
+        
+        # Handle required child_beaches field - if empty, provide a fallback
+        if not child_beach_ids:
+            log.warning("      ⚠️  No child beaches found for %s, providing fallback", location_name)
+            # Try to find at least one beach in this city from the locations sheet
+            locations_records = self._get_cached_sheet_data('locations')
+            fallback_beach_id = None
+            for location_record in locations_records:
+                if location_record.get('city', '') == location_name:
+                    beach_name = location_record.get('beach', '')
+                    if beach_name:
+                        search_slug = _search_slug(beach_name)
+                        existing_post = self.find_existing_post(search_slug, 'beach')
+                        if existing_post:
+                            fallback_beach_id = existing_post['id']
+                            log.info("      🔧 Using fallback beach: %s (ID: %s)", beach_name, fallback_beach_id)
+                            break
+            
+            if fallback_beach_id:
+                child_beach_ids = [fallback_beach_id]
+            else:
+                log.error("      ❌ No fallback beach found, this may cause validation errors")
+        
+        acf = CityAcf(
+            **core_fields,
+            beaches_safe=_as_int(data, 'beaches_safe'),
+            beaches_caution=_as_int(data, 'beaches_caution'),
+            beaches_avoid=_as_int(data, 'beaches_avoid'),
+            child_beaches=child_beach_ids,
+            parent_region=parent_region_id,
+            peak_cell_count=_as_int(data, 'peak_count'),
+            average_cell_count=_as_int(data, 'avg_count'),
+            average_confidence=_as_int(data, 'confidence_score'),
+            latest_sample_data=_or_none(data, 'sample_date'),
+            total_beaches=_as_int(data, 'beach_count'),
+            city_description=self._generate_city_description(location_name, data),
+            nearby_cities=self._get_nearby_cities(location_name, region),
+            nearby_beaches=self._get_nearby_beaches_for_city(location_name, region)
+        )
+        
+        # Debug: Log city ACF data
+        log.debug("   🔍 City ACF data for %s:", location_name)
+        log.debug("      - peak_cell_count: %s", acf.peak_cell_count)
+        log.debug("      - average_cell_count: %s", acf.average_cell_count)
+        log.debug("      - average_confidence: %s", acf.average_confidence)
+        log.debug("      - latest_sample_data: %s", acf.latest_sample_data)
+        log.debug("      - total_beaches: %s", acf.total_beaches)
+        log.debug("      - beaches_safe: %s", acf.beaches_safe)
+        log.debug("      - beaches_caution: %s", acf.beaches_caution)
+        log.debug("      - beaches_avoid: %s", acf.beaches_avoid)
+        log.debug("      - child_beaches (IDs): %s", child_beach_ids)
+        log.debug("      - parent_region (ID): %s", parent_region_id)
+        
+        return acf
+    
+    def _build_region_acf(self, data, core_fields):
+        """Build region ACF fields: child beaches/cities, counts and nearby regions"""
+        location_name = core_fields['location_name']
+        
+        # Get child post IDs
+        child_beach_ids = self._find_child_post_ids(location_name, 'beach')
+        child_city_ids = self._find_child_post_ids(location_name, 'city')
+        
+        acf = RegionAcf(
+            **core_fields,
+            peak_count=_as_int(data, 'peak_count'),
+            avg_count=_as_int(data, 'avg_count'),
+            confidence_score=_as_int(data, 'confidence_score'),
+            sample_date=_or_none(data, 'sample_date'),
+            beach_count=_as_int(data, 'beach_count'),
+            beaches_safe=_as_int(data, 'beaches_safe'),
+            beaches_caution=_as_int(data, 'beaches_caution'),
+            beaches_avoid=_as_int(data, 'beaches_avoid'),
+            city_count=_as_int(data, 'city_count'),
+            total_beaches=_as_int(data, 'beach_count'),
+            total_cities=_as_int(data, 'city_count'),
+            child_beaches=child_beach_ids,
+            child_cities=child_city_ids,
+            region_description=self._generate_region_description(location_name, data),
+            nearby_regions=self._get_nearby_regions(location_name)
+        )
+        
+        # Debug: Log region ACF data
+        log.debug("   🔍 Region ACF data for %s:", location_name)
+        log.debug("      - beach_count: %s", acf.beach_count)
+        log.debug("      - city_count: %s", acf.city_count)
+        log.debug("      - beaches_safe: %s", acf.beaches_safe)
+        log.debug("      - beaches_caution: %s", acf.beaches_caution)
+        log.debug("      - beaches_avoid: %s", acf.beaches_avoid)
+        log.debug("      - child_beaches (IDs): %s", child_beach_ids)
+        log.debug("      - child_cities (IDs): %s", child_city_ids)
+        
+        return acf
+    
+    # post_type -> ACF builder, used by _prepare_post_data
+    _ACF_BUILDERS = {
+        'beach': _build_beach_acf,
+        'city': _build_city_acf,
+        'region': _build_region_acf
+    }
+    
     def _get_beach_location_data(self, beach_name):
         """Get additional beach data from locations sheet"""
         if self.wordpress_test_only:
@@ -954,54 +1503,55 @@ class WordPressSyncer:
             }
             
         try:
-            records = self._get_cached_sheet_data('locations')
-            
-            for record in records:
-                if record.get('beach', '') == beach_name:
-                    # Get latitude and longitude values
-                    lat = record.get('latitude')
-                    lon = record.get('longitude')
-                    
-                    # Only create coordinates if both lat and lon are present and valid
-                    coordinates = None
-                    if lat is not None and lon is not None and str(lat).strip() and str(lon).strip():
-                        try:
-                            # Convert to float to validate they are numbers
-                            lat_float = float(lat)
-                            lon_float = float(lon)
-                            coordinates = f"{lat_float}, {lon_float}"
-                        except (ValueError, TypeError):
-                            print(f"      ⚠️  Invalid coordinates for {beach_name}: lat={lat}, lon={lon}")
-                            coordinates = None
-                    
-                    # Debug: Log coordinate extraction
-                    if coordinates:
-                        print(f"      ✅ Extracted coordinates for {beach_name}: {coordinates}")
-                    else:
-                        print(f"      ⚠️  No valid coordinates found for {beach_name}")
-                        print(f"         Raw lat: {lat}, Raw lon: {lon}")
-                    
-                    # For Google Maps field, return coordinates in the expected format
-                    # Google Maps fields typically expect: lat, lng, address, zoom
-                    google_maps_data = None
-                    if coordinates:
-                        try:
-                            lat_float, lon_float = coordinates.split(', ')
-                            google_maps_data = {
-                                'lat': float(lat_float),
-                                'lng': float(lon_float),
-                                'address': record.get('address', '') or '',
-                                'zoom': 15  # Default zoom level for beach locations
-                            }
-                        except (ValueError, AttributeError):
-                            print(f"      ⚠️  Could not parse coordinates for Google Maps: {coordinates}")
-                            google_maps_data = None
-                    
-                    return {
-                        'coordinates': google_maps_data,  # Now returns Google Maps format
-                        'address': record.get('address', '') or None,
-                        'zip': str(record.get('zip', '')) if record.get('zip') else None
-                    }
+            if self.location_by_beach is None:
+                self._build_sheet_indexes()
+            
+            record = self.location_by_beach.get(beach_name)
+            if record is not None:
+                # Get latitude and longitude values
+                lat = record.get('latitude')
+                lon = record.get('longitude')
+                
+                # Only create coordinates if both lat and lon are present and valid
+                coordinates = None
+                if lat is not None and lon is not None and str(lat).strip() and str(lon).strip():
+                    try:
+                        # Convert to float to validate they are numbers
+                        lat_float = float(lat)
+                        lon_float = float(lon)
+                        coordinates = f"{lat_float}, {lon_float}"
+                    except (ValueError, TypeError):
+                        print(f"      ⚠️  Invalid coordinates for {beach_name}: lat={lat}, lon={lon}")
+                        coordinates = None
+                
+                # Debug: Log coordinate extraction
+                if coordinates:
+                    print(f"      ✅ Extracted coordinates for {beach_name}: {coordinates}")
+                else:
+                    print(f"      ⚠️  No valid coordinates found for {beach_name}")
+                    print(f"         Raw lat: {lat}, Raw lon: {lon}")
+                
+                # For Google Maps field, return coordinates in the expected format
+                # Google Maps fields typically expect: lat, lng, address, zoom
+                google_maps_data = None
+                if coordinates:
+                    try:
+                        lat_float, lon_float = coordinates.split(', ')
+                        google_maps_data = {
+                            'lat': float(lat_float),
+                            'lng': float(lon_float),
+                            'address': record.get('address', '') or '',
+                            'zoom': 15  # Default zoom level for beach locations
+                        }
+                    except (ValueError, AttributeError):
+                        print(f"      ⚠️  Could not parse coordinates for Google Maps: {coordinates}")
+                        google_maps_data = None
+                
+                return {
+                    'coordinates': google_maps_data,  # Now returns Google Maps format
+                    'address': record.get('address', '') or None,
+                    'zip': str(record.get('zip', '')) if record.get('zip') else None
+                }
             
             return {}
             
@@ -1031,38 +1581,58 @@ class WordPressSyncer:
             ]
             
         try:
-            # Get cached data from both sheets
-            locations_records = self._get_cached_sheet_data('locations')
-            sample_records = self._get_cached_sheet_data('sample_mapping')
+            # Build the city index on first use (e.g. when preload was skipped or cleared)
+            if self.city_to_hab_samples is None:
+                self._build_hab_site_lookups()
             
-            # Create a mapping of beach names to cities
-            beach_to_city = {}
-            for location_record in locations_records:
-                beach_name = location_record.get('beach', '')
-                beach_city = location_record.get('city', '')
-                if beach_name and beach_city:
-                    beach_to_city[beach_name] = beach_city
-            
-            hab_sites = []
-            for record in sample_records:
-                beach_name = record.get('beach', '')
-                
-                # Check if this beach belongs to the target city
-                if beach_name in beach_to_city and beach_to_city[beach_name] == city_name:
-                    hab_sites.append({
-                        'hab_id': record.get('HAB_id', ''),
-                        'sample_location': record.get('sample_location', ''),
-                        'distance_miles': str(record.get('sample_distance', 0)),
-                        'cell_count': str(record.get('cell_count', 0)),
-                        'sample_date': record.get('sample_date', '')
-                    })
-            
-            return hab_sites
+            return [
+                {
+                    'hab_id': sample.hab_id,
+                    'sample_location': sample.sample_location,
+                    'distance_miles': sample.distance_miles,
+                    'cell_count': sample.cell_count,
+                    'sample_date': sample.sample_date
+                }
+                for sample in self.city_to_hab_samples.get(city_name, [])
+            ]
             
         except Exception as e:
             print(f"   Warning: Could not load HAB sampling sites for {city_name}: {e}")
             return []
     
+    def _build_hab_site_lookups(self):
+        """Group HAB sample rows by city and by beach in a single pass over sample_mapping"""
+        locations_records = self._get_cached_sheet_data('locations')
+        sample_records = self._get_cached_sheet_data('sample_mapping')
+        
+        # Create a mapping of beach names to cities
+        beach_to_city = {}
+        for location_record in locations_records:
+            beach_name = location_record.get('beach', '')
+            beach_city = location_record.get('city', '')
+            if beach_name and beach_city:
+                beach_to_city[beach_name] = beach_city
+        
+        city_to_hab_samples = {}
+        beach_to_hab_samples = {}
+        for record in sample_records:
+            sample = HabSample(
+                record.get('beach', ''),
+                record.get('HAB_id', ''),
+                record.get('sample_location', ''),
+                str(record.get('sample_distance', 0)),
+                str(record.get('cell_count', 0)),
+                record.get('sample_date', '')
+            )
+            beach_to_hab_samples.setdefault(sample.beach, []).append(sample)
+            
+            city_name = beach_to_city.get(sample.beach)
+            if city_name:
+                city_to_hab_samples.setdefault(city_name, []).append(sample)
+        
+        self.city_to_hab_samples = city_to_hab_samples
+        self.beach_to_hab_samples = beach_to_hab_samples
+    
     def _get_beach_sampling_sites(self, beach_name):
         """Get HAB sampling sites for a specific beach"""
         if self.wordpress_test_only:
@@ -1078,25 +1648,26 @@ class WordPressSyncer:
             ]
             
         try:
-            sample_records = self._get_cached_sheet_data('sample_mapping')
-            
-            sampling_sites = []
-            for record in sample_records:
-                if record.get('beach', '') == beach_name:
-                    sampling_sites.append({
-                        'hab_id': record.get('HAB_id', ''),
-                        'sample_location': record.get('sample_location', ''),
-                        'distance_miles': str(record.get('sample_distance', 0)),
-                        'current_concentration': str(record.get('cell_count', 0)),
-                        'sample_date': record.get('sample_date', '')
-                    })
+            # Build the beach index on first use (e.g. when preload was skipped or cleared)
+            if self.beach_to_hab_samples is None:
+                self._build_hab_site_lookups()
             
-            return sampling_sites
+            return [
+                {
+                    'hab_id': sample.hab_id,
+                    'sample_location': sample.sample_location,
+                    'distance_miles': sample.distance_miles,
+                    'current_concentration': sample.cell_count,
+                    'sample_date': sample.sample_date
+                }
+                for sample in self.beach_to_hab_samples.get(beach_name, [])
+            ]
             
         except Exception as e:
             print(f"   Warning: Could not load sampling sites for {beach_name}: {e}")
             return []
     
+    @memoize_per_sync
     def _find_parent_post_id(self, parent_name, post_type):
         """Find post ID for parent city or region"""
         if not parent_name:
@@ -1104,7 +1675,7 @@ class WordPressSyncer:
             
         try:
             # Search for existing post by name
-            search_slug = f"{parent_name.lower().replace(' ', '-')}-red-tide"
+            search_slug = _search_slug(parent_name)
             existing_post = self.find_existing_post(search_slug, post_type)
             return existing_post['id'] if existing_post else None
         except Exception as e:
@@ -1121,10 +1692,10 @@ class WordPressSyncer:
         try:
             if child_type == 'beach':
                 # For beaches, search through WordPress beach posts to find those belonging to the city
-                search_url = f"{self.wp_site_url}/wp-json/wp/v2/beaches"
-                params = {'per_page': 100}  # Get more beaches to search through
+                search_url = f"{self.wp_site_url}/wp-json/wp/v2/{self.rest_endpoints['beach']}"
+                params = {'per_page': 100, '_fields': 'id,slug,title'}  # Get more beaches to search through
                 
-                response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
+                response = self.http.get(search_url, params=params, timeout=self.request_timeout)
                 
                 if response.status_code == 200:
                     beaches = response.json()
@@ -1151,26 +1722,20 @@ class WordPressSyncer:
                     return []
             else:
                 # For cities, use the original logic with beach_status data
-                beach_status_records = self._get_cached_sheet_data('beach_status')
-                
                 child_ids = []
-                for record in beach_status_records:
-                    record_parent = record.get('region', '')
-                    record_type = record.get('location_type', '').lower()
-                    
-                    # Match parent and child type
-                    if record_parent == parent_name and record_type == child_type:
-                        # Try to find the WordPress post ID for this location
-                        location_name = record.get('location_name', '')
-                        if location_name:
-                            # Search for existing post
-                            search_slug = f"{location_name.lower().replace(' ', '-')}-red-tide"
-                            existing_post = self.find_existing_post(search_slug, child_type)
-                            if existing_post:
-                                child_ids.append(existing_post['id'])
-                                print(f"      ✅ Found child {child_type}: {location_name} (ID: {existing_post['id']})")
-                            else:
-                                print(f"      ⚠️  Child {child_type} {location_name} not found in WordPress")
+                # Rows of the child type under this parent
+                for record in self._status_records(child_type, parent_name):
+                    # Try to find the WordPress post ID for this location
+                    location_name = record.get('location_name', '')
+                    if location_name:
+                        # Search for existing post
+                        search_slug = _search_slug(location_name)
+                        existing_post = self.find_existing_post(search_slug, child_type)
+                        if existing_post:
+                            child_ids.append(existing_post['id'])
+                            print(f"      ✅ Found child {child_type}: {location_name} (ID: {existing_post['id']})")
+                        else:
+                            print(f"      ⚠️  Child {child_type} {location_name} not found in WordPress")
                 
                 print(f"      📊 Total child {child_type}s found for {parent_name}: {len(child_ids)}")
                 return child_ids
@@ -1181,48 +1746,24 @@ class WordPressSyncer:
     
     def _generate_beach_description(self, beach_name, data):
         """Generate a description for a beach"""
+        templates = DESCRIPTION_TEMPLATES['beach']
         status = data.get('current_status', 'no_data')
-        peak_count = data.get('peak_count', 0)
-        city = data.get('city', '')
-        
-        if status == 'safe':
-            return f"{beach_name} in {city}, Florida currently has safe red tide conditions with low cell counts ({peak_count} cells/L). The beach is open for swimming and recreation."
-        elif status == 'caution':
-            return f"{beach_name} in {city}, Florida is experiencing moderate red tide conditions ({peak_count} cells/L). Visitors should exercise caution and check for any posted advisories."
-        elif status == 'avoid':
-            return f"{beach_name} in {city}, Florida has high red tide levels ({peak_count} cells/L). Swimming and water activities are not recommended at this time."
-        else:
-            return f"{beach_name} in {city}, Florida. Current red tide monitoring data is being collected to assess conditions."
+        return templates.get(status, templates['no_data']).format(
+            name=beach_name, city=data.get('city', ''), peak_count=data.get('peak_count', 0))
     
     def _generate_city_description(self, city_name, data):
         """Generate a description for a city"""
+        templates = DESCRIPTION_TEMPLATES['city']
         status = data.get('current_status', 'no_data')
-        beach_count = data.get('beach_count', 0)
-        region = data.get('region', '')
-        
-        if status == 'safe':
-            return f"{city_name} in {region}, Florida has {beach_count} monitored beaches, all currently showing safe red tide conditions. The area is open for beach activities."
-        elif status == 'caution':
-            return f"{city_name} in {region}, Florida has {beach_count} monitored beaches with some showing moderate red tide conditions. Check individual beach status before visiting."
-        elif status == 'avoid':
-            return f"{city_name} in {region}, Florida has {beach_count} monitored beaches with high red tide levels. Beach activities are not recommended at this time."
-        else:
-            return f"{city_name} in {region}, Florida has {beach_count} monitored beaches. Current red tide monitoring data is being collected."
+        return templates.get(status, templates['no_data']).format(
+            name=city_name, region=data.get('region', ''), beach_count=data.get('beach_count', 0))
     
     def _generate_region_description(self, region_name, data):
         """Generate a description for a region"""
+        templates = DESCRIPTION_TEMPLATES['region']
         status = data.get('current_status', 'no_data')
-        beach_count = data.get('beach_count', 0)
-        city_count = data.get('city_count', 0)
-        
-        if status == 'safe':
-            return f"{region_name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches, all currently showing safe red tide conditions."
-        elif status == 'caution':
-            return f"{region_name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches with some areas showing moderate red tide conditions."
-        elif status == 'avoid':
-            return f"{region_name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches with high red tide levels affecting multiple areas."
-        else:
-            return f"{region_name} region in Florida encompasses {city_count} cities and {beach_count} monitored beaches. Comprehensive red tide monitoring is ongoing."
+        return templates.get(status, templates['no_data']).format(
+            name=region_name, beach_count=data.get('beach_count', 0), city_count=data.get('city_count', 0))
     
     def _get_nearby_beaches(self, beach_name, region_name):
         """Get nearby beaches for a specific beach - now optimized"""
@@ -1243,55 +1784,41 @@ class WordPressSyncer:
         
         # Fallback to original method
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            locations_records = self._get_cached_sheet_data('locations')
-            
             # Get coordinates for the target beach
-            target_lat, target_lon = None, None
-            for location_record in locations_records:
-                if location_record.get('beach', '') == beach_name:
-                    target_lat, target_lon = self._extract_coordinates_from_record(location_record)
-                    break
+            target_position = self._beach_position(beach_name)
             
-            if target_lat is None or target_lon is None:
+            if target_position is None:
                 print(f"   Warning: No coordinates found for {beach_name}, using region-based filtering")
                 # Fallback to region-based filtering
                 return self._get_nearby_beaches_fallback(beach_name, region_name)
             
             nearby_beaches = []
-            for record in beach_status_records:
+            # Other beaches in the same region
+            for record in self._status_records('beach', region_name):
                 record_name = record.get('location_name', '')
-                record_type = record.get('location_type', '').lower()
-                record_region = record.get('region', '')
-                
-                # Find other beaches in the same region
-                if (record_type == 'beach' and 
-                    record_name != beach_name and 
-                    record_region == region_name):
+                if record_name != beach_name:
                     
                     # Get coordinates for this beach
-                    beach_lat, beach_lon = None, None
-                    for location_record in locations_records:
-                        if location_record.get('beach', '') == record_name:
-                            beach_lat, beach_lon = self._extract_coordinates_from_record(location_record)
-                            break
+                    beach_position = self._beach_position(record_name)
                     
-                    if beach_lat is not None and beach_lon is not None:
-                        # Calculate actual distance
-                        distance = self._calculate_distance(target_lat, target_lon, beach_lat, beach_lon)
-                        
-                        # Only include beaches within 25 miles
-                        if distance <= 25.0:
+                    if beach_position is not None:
+                        # Only include beaches within 25 miles; the cut-off is checked on the haversine term
+                        # so beaches out of range never pay for asin/sqrt
+                        a = self._haversine_a_between(target_position, beach_position, NEARBY_BEACH_MAX_DLAT)
+                        if a <= NEARBY_BEACH_HAVERSINE_A:
+                            distance = self._haversine_miles(a)
+                            
                             # Try to find the WordPress post ID
-                            search_slug = f"{record_name.lower().replace(' ', '-')}-red-tide"
+                            search_slug = _search_slug(record_name)
                             existing_post = self.find_existing_post(search_slug, 'beach')
                             
+                            current_status = record.get('current_status', 'no_data')
                             nearby_beaches.append({
                                 'beach': existing_post['id'] if existing_post else None,
                                 'distance': round(distance, 1),
-                                'current_status': record.get('current_status', 'no_data'),
-                                'status_color': self.get_status_color(record.get('current_status', 'no_data')),
-                                'description': f"{record_name} - {record.get('current_status', 'no_data')} conditions"
+                                'current_status': current_status,
+                                'status_color': self.get_status_color(current_status),
+                                'description': f"{record_name} - {current_status} conditions"
                             })
             
             # Sort by distance and limit to 5 nearest beaches
@@ -1306,32 +1833,22 @@ class WordPressSyncer:
         """Optimized version of _get_nearby_beaches using pre-built lookups"""
         try:
             # Use pre-built lookup to get all beaches in the region
-            if region_name not in self.region_to_beaches:
+            beach_names = self.region_to_beaches.get(region_name)
+            if not beach_names:
                 return []
             
-            beach_names = list(self.region_to_beaches[region_name])  # Convert set to list
             nearby_beaches = []
             
             # Get coordinates for the target beach
-            locations_records = self._get_cached_sheet_data('locations')
-            target_lat, target_lon = None, None
-            for location_record in locations_records:
-                if location_record.get('beach', '') == beach_name:
-                    target_lat, target_lon = self._extract_coordinates_from_record(location_record)
-                    break
+            target_position = self._beach_position(beach_name)
             
-            if target_lat is None or target_lon is None:
+            if target_position is None:
                 print(f"   Warning: No coordinates found for {beach_name}, using region-based filtering")
                 # Fallback to region-based filtering
                 return self._get_nearby_beaches_fallback(beach_name, region_name)
             
             # Get beach status data for the region
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            beach_status_lookup = {}
-            for record in beach_status_records:
-                if (record.get('location_type', '').lower() == 'beach' and 
-                    record.get('region', '') == region_name):
-                    beach_status_lookup[record.get('location_name', '')] = record
+            beach_status_lookup = self._latest_status_by_name('beach', region_name)
             
             # Process each beach in the region
             for other_beach_name in beach_names:
@@ -1339,18 +1856,15 @@ class WordPressSyncer:
                     continue
                 
                 # Get coordinates for this beach
-                beach_lat, beach_lon = None, None
-                for location_record in locations_records:
-                    if location_record.get('beach', '') == other_beach_name:
-                        beach_lat, beach_lon = self._extract_coordinates_from_record(location_record)
-                        break
+                beach_position = self._beach_position(other_beach_name)
                 
-                if beach_lat is not None and beach_lon is not None:
-                    # Calculate actual distance
-                    distance = self._calculate_distance(target_lat, target_lon, beach_lat, beach_lon)
-                    
-                    # Only include beaches within 25 miles
-                    if distance <= 25.0:
+                if beach_position is not None:
+                    # Only include beaches within 25 miles; the cut-off is checked on the haversine term
+                    # so beaches out of range never pay for asin/sqrt
+                    a = self._haversine_a_between(target_position, beach_position, NEARBY_BEACH_MAX_DLAT)
+                    if a <= NEARBY_BEACH_HAVERSINE_A:
+                        distance = self._haversine_miles(a)
+                        
                         # Get post ID from pre-fetched lookup
                         post_id = self.location_to_post_id['beach'].get(other_beach_name)
                         
@@ -1377,34 +1891,25 @@ class WordPressSyncer:
     def _get_nearby_beaches_fallback(self, beach_name, region_name):
         """Fallback method for nearby beaches when coordinates are unavailable"""
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            
             nearby_beaches = []
-            for record in beach_status_records:
+            # Other beaches in the same region, limited to 5
+            others = (record for record in self._status_records('beach', region_name)
+                      if record.get('location_name', '') != beach_name)
+            for record in islice(others, 5):
                 record_name = record.get('location_name', '')
-                record_type = record.get('location_type', '').lower()
-                record_region = record.get('region', '')
                 
-                # Find other beaches in the same region
-                if (record_type == 'beach' and 
-                    record_name != beach_name and 
-                    record_region == region_name):
-                    
-                    # Try to find the WordPress post ID
-                    search_slug = f"{record_name.lower().replace(' ', '-')}-red-tide"
-                    existing_post = self.find_existing_post(search_slug, 'beach')
-                    
-                    nearby_beaches.append({
-                        'beach': existing_post['id'] if existing_post else None,
-                        'distance': 2.5,  # Fallback distance
-                        'current_status': record.get('current_status', 'no_data'),
-                        'status_color': self.get_status_color(record.get('current_status', 'no_data')),
-                        'description': f"{record_name} - {record.get('current_status', 'no_data')} conditions"
-                    })
-                    
-                    # Limit to 5 nearby beaches
-                    if len(nearby_beaches) >= 5:
-                        break
+                # Try to find the WordPress post ID
+                search_slug = _search_slug(record_name)
+                existing_post = self.find_existing_post(search_slug, 'beach')
+                
+                current_status = record.get('current_status', 'no_data')
+                nearby_beaches.append({
+                    'beach': existing_post['id'] if existing_post else None,
+                    'distance': 2.5,  # Fallback distance
+                    'current_status': current_status,
+                    'status_color': self.get_status_color(current_status),
+                    'description': f"{record_name} - {current_status} conditions"
+                })
             
             return nearby_beaches
             
@@ -1426,7 +1931,6 @@ class WordPressSyncer:
             ]
             
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
             locations_records = self._get_cached_sheet_data('locations')
             
             # Get coordinates for the target city (use first beach in city as reference)
@@ -1442,40 +1946,34 @@ class WordPressSyncer:
                 # Fallback to city-based filtering
                 return self._get_nearby_beaches_for_city_fallback(city_name, region_name)
             
+            target_position = self._position(target_lat, target_lon)
             nearby_beaches = []
-            for record in beach_status_records:
+            # Beaches in the same city
+            for record in self._status_records('beach', city_name=city_name):
                 record_name = record.get('location_name', '')
-                record_type = record.get('location_type', '').lower()
-                record_city = record.get('city', '')
                 
-                # Find beaches in the same city
-                if (record_type == 'beach' and 
-                    record_city == city_name):
-                    
-                    # Get coordinates for this beach
-                    beach_lat, beach_lon = None, None
-                    for location_record in locations_records:
-                        if location_record.get('beach', '') == record_name:
-                            beach_lat, beach_lon = self._extract_coordinates_from_record(location_record)
-                            break
-                    
-                    if beach_lat is not None and beach_lon is not None:
-                        # Calculate actual distance
-                        distance = self._calculate_distance(target_lat, target_lon, beach_lat, beach_lon)
+                # Get coordinates for this beach
+                beach_position = self._beach_position(record_name)
+                
+                if beach_position is not None:
+                    # Only include beaches within 15 miles; the cut-off is checked on the haversine term
+                    # so beaches out of range never pay for asin/sqrt
+                    a = self._haversine_a_between(target_position, beach_position, NEARBY_CITY_BEACH_MAX_DLAT)
+                    if a <= NEARBY_CITY_BEACH_HAVERSINE_A:
+                        distance = self._haversine_miles(a)
                         
-                        # Only include beaches within 15 miles
-                        if distance <= 15.0:
-                            # Try to find the WordPress post ID
-                            search_slug = f"{record_name.lower().replace(' ', '-')}-red-tide"
-                            existing_post = self.find_existing_post(search_slug, 'beach')
-                            
-                            nearby_beaches.append({
-                                'beach': existing_post['id'] if existing_post else None,
-                                'distance': round(distance, 1),
-                                'current_status': record.get('current_status', 'no_data'),
-                                'status_color': self.get_status_color(record.get('current_status', 'no_data')),
-                                'description': f"{record_name} - {record.get('current_status', 'no_data')} conditions"
-                            })
+                        # Try to find the WordPress post ID
+                        search_slug = _search_slug(record_name)
+                        existing_post = self.find_existing_post(search_slug, 'beach')
+                        
+                        current_status = record.get('current_status', 'no_data')
+                        nearby_beaches.append({
+                            'beach': existing_post['id'] if existing_post else None,
+                            'distance': round(distance, 1),
+                            'current_status': current_status,
+                            'status_color': self.get_status_color(current_status),
+                            'description': f"{record_name} - {current_status} conditions"
+                        })
             
             # Sort by distance and limit to 8 nearest beaches
             nearby_beaches.sort(key=lambda x: x['distance'])
@@ -1488,33 +1986,23 @@ class WordPressSyncer:
     def _get_nearby_beaches_for_city_fallback(self, city_name, region_name):
         """Fallback method for nearby beaches for city when coordinates are unavailable"""
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            
             nearby_beaches = []
-            for record in beach_status_records:
+            # Beaches in the same city, limited to 8
+            for record in islice(self._status_records('beach', city_name=city_name), 8):
                 record_name = record.get('location_name', '')
-                record_type = record.get('location_type', '').lower()
-                record_city = record.get('city', '')
                 
-                # Find beaches in the same city
-                if (record_type == 'beach' and 
-                    record_city == city_name):
-                    
-                    # Try to find the WordPress post ID
-                    search_slug = f"{record_name.lower().replace(' ', '-')}-red-tide"
-                    existing_post = self.find_existing_post(search_slug, 'beach')
-                    
-                    nearby_beaches.append({
-                        'beach': existing_post['id'] if existing_post else None,
-                        'distance': 1.5,  # Fallback distance
-                        'current_status': record.get('current_status', 'no_data'),
-                        'status_color': self.get_status_color(record.get('current_status', 'no_data')),
-                        'description': f"{record_name} - {record.get('current_status', 'no_data')} conditions"
-                    })
-                    
-                    # Limit to 8 nearby beaches
-                    if len(nearby_beaches) >= 8:
-                        break
+                # Try to find the WordPress post ID
+                search_slug = _search_slug(record_name)
+                existing_post = self.find_existing_post(search_slug, 'beach')
+                
+                current_status = record.get('current_status', 'no_data')
+                nearby_beaches.append({
+                    'beach': existing_post['id'] if existing_post else None,
+                    'distance': 1.5,  # Fallback distance
+                    'current_status': current_status,
+                    'status_color': self.get_status_color(current_status),
+                    'description': f"{record_name} - {current_status} conditions"
+                })
             
             return nearby_beaches
             
@@ -1541,31 +2029,19 @@ class WordPressSyncer:
         
         # Fallback to original method
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            
             # Get unique cities in the same region (region-based logic)
-            cities_in_region = set()
-            for record in beach_status_records:
-                record_city = record.get('city', '')
-                record_region = record.get('region', '')
-                record_type = record.get('location_type', '').lower()
-                
-                if record_type == 'city' and record_region == region_name and record_city != city_name:
-                    cities_in_region.add(record_city)
+            cities_in_region = {record.get('city', '') for record in self._status_records('city', region_name)
+                                if record.get('city', '') != city_name}
             
+            city_statuses = self._first_status_by_name('city')
             nearby_cities = []
-            for city in list(cities_in_region):  # No limit - include all cities in region
+            for city in sorted(cities_in_region):  # No limit - include all cities in region
                 # Try to find the WordPress post ID
-                search_slug = f"{city.lower().replace(' ', '-')}-red-tide"
+                search_slug = _search_slug(city)
                 existing_post = self.find_existing_post(search_slug, 'city')
                 
                 # Get city status from records
-                city_status = 'no_data'
-                for record in beach_status_records:
-                    if (record.get('location_name', '') == city and 
-                        record.get('location_type', '').lower() == 'city'):
-                        city_status = record.get('current_status', 'no_data')
-                        break
+                city_status = city_statuses.get(city, 'no_data')
                 
                 nearby_cities.append({
                     'city': existing_post['id'] if existing_post else None,
@@ -1585,19 +2061,14 @@ class WordPressSyncer:
         """Optimized version of _get_nearby_cities using pre-built lookups"""
         try:
             # Use pre-built lookup to get all cities in the region
-            if region_name not in self.region_to_cities:
+            city_names = self.region_to_cities.get(region_name)
+            if not city_names:
                 return []
             
-            city_names = list(self.region_to_cities[region_name])  # Convert set to list
             nearby_cities = []
             
             # Get beach status data for the region to get city statuses
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            city_status_lookup = {}
-            for record in beach_status_records:
-                if (record.get('location_type', '').lower() == 'city' and 
-                    record.get('region', '') == region_name):
-                    city_status_lookup[record.get('location_name', '')] = record
+            city_status_lookup = self._latest_status_by_name('city', region_name)
             
             # Process each city in the region (excluding the current city)
             for other_city_name in city_names:
@@ -1630,31 +2101,19 @@ class WordPressSyncer:
         # Note: This method now uses the same region-based logic as the primary method
         # Keeping it for backward compatibility but it's functionally identical
         try:
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            
             # Get unique cities in the same region
-            cities_in_region = set()
-            for record in beach_status_records:
-                record_city = record.get('city', '')
-                record_region = record.get('region', '')
-                record_type = record.get('location_type', '').lower()
-                
-                if record_type == 'city' and record_region == region_name and record_city != city_name:
-                    cities_in_region.add(record_city)
+            cities_in_region = {record.get('city', '') for record in self._status_records('city', region_name)
+                                if record.get('city', '') != city_name}
             
+            city_statuses = self._first_status_by_name('city')
             nearby_cities = []
-            for city in list(cities_in_region):  # No limit - include all cities in region
+            for city in sorted(cities_in_region):  # No limit - include all cities in region
                 # Try to find the WordPress post ID
-                search_slug = f"{city.lower().replace(' ', '-')}-red-tide"
+                search_slug = _search_slug(city)
                 existing_post = self.find_existing_post(search_slug, 'city')
                 
                 # Get city status from records
-                city_status = 'no_data'
-                for record in beach_status_records:
-                    if (record.get('location_name', '') == city and 
-                        record.get('location_type', '').lower() == 'city'):
-                        city_status = record.get('current_status', 'no_data')
-                        break
+                city_status = city_statuses.get(city, 'no_data')
                 
                 nearby_cities.append({
                     'city': existing_post['id'] if existing_post else None,
@@ -1670,6 +2129,7 @@ class WordPressSyncer:
             print(f"   Warning: Could not get nearby cities fallback for {city_name}: {e}")
             return []
     
+    @memoize_per_sync
     def _get_nearby_regions(self, region_name):
         """Get nearby regions for a specific region - now optimized"""
         if self.wordpress_test_only:
@@ -1698,19 +2158,15 @@ class WordPressSyncer:
                 if record_region and record_region != region_name:
                     all_regions.add(record_region)
             
+            region_statuses = self._first_status_by_name('region')
             nearby_regions = []
-            for region in list(all_regions)[:3]:  # Limit to 3 nearby regions
+            for region in islice(sorted(all_regions), 3):  # Limit to 3 nearby regions
                 # Try to find the WordPress post ID
-                search_slug = f"{region.lower().replace(' ', '-')}-red-tide"
+                search_slug = _search_slug(region)
                 existing_post = self.find_existing_post(search_slug, 'region')
                 
                 # Get region status from records
-                region_status = 'no_data'
-                for record in beach_status_records:
-                    if (record.get('location_name', '') == region and 
-                        record.get('location_type', '').lower() == 'region'):
-                        region_status = record.get('current_status', 'no_data')
-                        break
+                region_status = region_statuses.get(region, 'no_data')
                 
                 nearby_regions.append({
                     'region': existing_post['id'] if existing_post else None,
@@ -1730,21 +2186,15 @@ class WordPressSyncer:
         """Optimized version of _get_nearby_regions using pre-built lookups"""
         try:
             # Use pre-built lookup to get all regions
-            all_regions = list(self.region_to_beaches.keys())  # Convert set to list
+            all_regions = self.region_to_beaches
             nearby_regions = []
             
             # Get beach status data to get region statuses
-            beach_status_records = self._get_cached_sheet_data('beach_status')
-            region_status_lookup = {}
-            for record in beach_status_records:
-                if record.get('location_type', '').lower() == 'region':
-                    region_status_lookup[record.get('location_name', '')] = record
+            region_status_lookup = self._latest_status_by_name('region')
             
             # Process each region (excluding the current region, limit to 3)
-            for other_region_name in all_regions:
-                if other_region_name == region_name:
-                    continue
-                
+            other_regions = (name for name in all_regions if name != region_name)
+            for other_region_name in islice(other_regions, 3):
                 # Get post ID from pre-fetched lookup
                 post_id = self.location_to_post_id['region'].get(other_region_name)
                 
@@ -1759,10 +2209,6 @@ class WordPressSyncer:
                     'status_color': self.get_status_color(current_status),
                     'description': f"{other_region_name} - {current_status} conditions"
                 })
-                
-                # Limit to 3 nearby regions
-                if len(nearby_regions) >= 3:
-                    break
             
             return nearby_regions
             
@@ -1770,32 +2216,74 @@ class WordPressSyncer:
             print(f"   Warning: Could not get nearby regions optimized for {region_name}: {e}")
             return []
     
-    def sync_post_type(self, data_list, post_type):
+    def sync_post_type(self, data_list, post_type, executor=None, existing_ids=_NOT_LISTED):
         """Sync all posts of a specific type"""
         if not data_list:
             print(f"📝 No {post_type} data to sync")
             return []
         
+        if executor is None:
+            with ThreadPoolExecutor(max_workers=min(self.sync_concurrency, len(data_list))) as own_executor:
+                return self.sync_post_type(data_list, post_type, own_executor, existing_ids)
+        
         print(f"\n📝 Syncing {len(data_list)} {post_type} posts...")
         
         created_ids = []
         success_count = 0
         
+        # One paginated listing replaces a slug search per post (unless run() already tried it)
+        if existing_ids is _NOT_LISTED:
+            existing_ids = self._load_existing_ids(post_type)
+        if existing_ids is None:
+            # Listing failed; still resolve every slug in batches rather than one search per post
+            self._prefetch_existing_posts(post_type, [self._target_slug(data) for data in data_list])
+        
+        # Child/nearby links look posts up by location name; take the IDs from the slug index
+        # rather than relying only on the title/slug matching of the first 100 posts
+        location_ids = self.location_to_post_id.setdefault(post_type, {})
         for data in data_list:
-            post_id = self.create_or_update_post(data, post_type)
+            post_id = self.post_index.get((post_type, self._target_slug(data)))
+            if post_id:
+                location_ids[data['location_name']] = post_id
+        
+        # Posts of one type are independent, so sync them concurrently; results keep input order.
+        # Every WordPress call goes through the shared _rate_limit, so no per-post sleep is needed.
+        results = executor.map(lambda data: self.create_or_update_post(data, post_type, existing_ids), data_list)
+        for post_id in results:
             if post_id:
                 created_ids.append(post_id)
                 success_count += 1
-            
-            # Rate limiting
-            time.sleep(2)
         
         print(f"   ✅ {success_count}/{len(data_list)} {post_type} posts synced successfully")
         return created_ids
     
+    def _sync_deferred_relinks(self, executor, existing_ids):
+        """Re-sync posts whose parent, child or nearby links pointed at posts created later in this run"""
+        if not self._deferred_relinks:
+            return
+        
+        # Lookups were memoized as missing during the earlier stages
+        self._sync_memo.clear()
+        
+        pending = {}
+        for post_type, data, sent_acf in self._deferred_relinks:
+            # Only re-sync when rebuilding the ACF fields now resolves a link that was missing
+            rebuilt = self._prepare_post_data(data, post_type, slug_override=self._target_slug(data))
+            if rebuilt['acf'] != sent_acf:
+                pending.setdefault(post_type, []).append(data)
+        self._deferred_relinks = []
+        
+        for post_type, data_list in pending.items():
+            print(f"\n🔗 Linking {len(data_list)} {post_type} posts to posts created in this run")
+            self.sync_post_type(data_list, post_type, executor, existing_ids.get(post_type, _NOT_LISTED))
+    
     def run(self):
         """Main execution function"""
         print("🔄 Starting WordPress sync...")
+        self._run_timestamp = datetime.now(self._eastern).strftime('%Y-%m-%d %H:%M:%S')
+        # Lookups are memoized per sync; drop anything left over from a previous run
+        self._sync_memo.clear()
+        self._deferred_relinks = []
         
         try:
             # 1. Load data from Google Sheets
@@ -1804,17 +2292,28 @@ class WordPressSyncer:
             # 2. Sync in hierarchical order (beaches → cities → regions)
             all_created_ids = []
             
-            # Sync beaches first
-            beach_ids = self.sync_post_type(sheet_data['beach'], 'beach')
-            all_created_ids.extend(beach_ids)
-            
-            # Sync cities
-            city_ids = self.sync_post_type(sheet_data['city'], 'city')
-            all_created_ids.extend(city_ids)
-            
-            # Sync regions
-            region_ids = self.sync_post_type(sheet_data['region'], 'region')
-            all_created_ids.extend(region_ids)
+            # One worker pool is shared by every stage
+            with ThreadPoolExecutor(max_workers=self.sync_concurrency) as executor:
+                # Listing existing posts doesn't depend on the hierarchy, so fetch all types at once
+                post_types = [t for t in ('beach', 'city', 'region') if sheet_data[t]]
+                existing_futures = {t: executor.submit(self._load_existing_ids, t) for t in post_types}
+                existing_ids = {t: future.result() for t, future in existing_futures.items()}
+                
+                # Stages stay sequential: cities link to beach posts and regions link to both
+                # Sync beaches first
+                beach_ids = self.sync_post_type(sheet_data['beach'], 'beach', executor, existing_ids.get('beach', _NOT_LISTED))
+                all_created_ids.extend(beach_ids)
+                
+                # Sync cities
+                city_ids = self.sync_post_type(sheet_data['city'], 'city', executor, existing_ids.get('city', _NOT_LISTED))
+                all_created_ids.extend(city_ids)
+                
+                # Sync regions
+                region_ids = self.sync_post_type(sheet_data['region'], 'region', executor, existing_ids.get('region', _NOT_LISTED))
+                all_created_ids.extend(region_ids)
+                
+                # Posts synced before their parent city/region existed get one more pass now
+                self._sync_deferred_relinks(executor, existing_ids)
             
             # 3. Summary
             total_beaches = len(sheet_data['beach'])
@@ -1836,17 +2335,15 @@ class WordPressSyncer:
         except Exception as e:
             print(f"\n❌ WordPress sync failed: {e}")
             raise
-    
-    def _generate_slug(self, name):
-        """Generate URL-friendly slug in format: <location-name>-red-tide"""
-        slug = name.lower()
-        slug = re.sub(r'[^a-z0-9\s-]', '', slug)
-        slug = re.sub(r'\s+', '-', slug)
-        slug = re.sub(r'-+', '-', slug)
-        slug = slug.strip('-')
-        return f"{slug}-red-tide"
 
 if __name__ == "__main__":
+    # Per-post debug output is only emitted with LOG_LEVEL=DEBUG
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+        format='%(message)s',
+        stream=sys.stdout
+    )
+    
     # Check for required environment variables
     required_vars = [
         'WORDPRESS_SITE_URL',
@@ -3,10 +3,15 @@
 Script to load environment variables from .env file for local testing
 """
 
+import logging
 import os
 import sys
 from pathlib import Path
 
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
 def load_env_file(env_file_path='.env'):
     """Load environment variables from .env file"""
     env_path = Path(env_file_path)
@@ -18,33 +23,78 @@ def load_env_file(env_file_path='.env'):
     
     print(f"📁 Loading environment variables from {env_file_path}")
     
-    with open(env_path, 'r') as f:
-        for line_num, line in enumerate(f, 1):
-            line = line.strip()
-            
-            # Skip empty lines and comments
-            if not line or line.startswith('#'):
-                continue
-            
-            # Parse key=value pairs
-            if '=' in line:
-                key, value = line.split('=', 1)
-                key = key.strip()
-                value = value.strip()
-                
-                # Remove quotes if present
-                if (value.startswith('"') and value.endswith('"')) or \
-                   (value.startswith("'") and value.endswith("'")):
-                    value = value[1:-1]
-                
-                os.environ[key] = value
-                print(f"  ✅ Loaded: {key}")
-            else:
-                print(f"  ⚠️  Skipping invalid line {line_num}: {line}")
+    invalid_lines = []
+    for key, value in parse_env_file(env_file_path, invalid_lines).items():
+        os.environ[key] = value
+        print(f"  ✅ Loaded: {key}")
+    for line_num, line in invalid_lines:
+        print(f"  ⚠️  Skipping invalid line {line_num}: {line}")
     
     print(f"✅ Environment variables loaded successfully!")
     return True
 
+def parse_env_file(env_file_path='.env', invalid_lines=None):
+    """Parse KEY=VALUE lines (surrounding quotes stripped) from a .env file in one read; {} if it is missing
+    
+    Lines without '=' are skipped, and appended as (line_num, line) to invalid_lines when a list is given.
+    """
+    env_path = Path(env_file_path)
+    if not env_path.exists():
+        return {}
+    
+    parsed = {}
+    for line_num, line in enumerate(env_path.read_text().splitlines(), 1):
+        line = line.strip()
+        
+        # Skip empty lines and comments
+        if not line or line.startswith('#'):
+            continue
+        
+        if '=' not in line:
+            if invalid_lines is not None:
+                invalid_lines.append((line_num, line))
+            continue
+        
+        key, value = line.split('=', 1)
+        key = key.strip()
+        value = value.strip()
+        
+        # Remove quotes if present
+        if (value.startswith('"') and value.endswith('"')) or \
+           (value.startswith("'") and value.endswith("'")):
+            value = value[1:-1]
+        
+        parsed[key] = value
+    return parsed
+
+def load_env_if_present(env_file_path='.env'):
+    """Apply a .env file when one exists, without the per-key output of load_env_file (used by the test scripts)"""
+    if Path(env_file_path).exists():
+        print(f"📁 Loading environment variables from {env_file_path}")
+        os.environ.update(parse_env_file(env_file_path))
+        print("✅ Environment variables loaded")
+
+def make_session(auth):
+    """One keep-alive WordPress session for a test script run, retrying transient 429/5xx answers with backoff
+    
+    urllib3 only re-sends idempotent methods, so POST updates are never repeated.
+    """
+    session = requests.Session()
+    session.auth = auth
+    retries = Retry(total=3, backoff_factor=0.5, status_forcelist=[429, 502, 503, 504], raise_on_status=False)
+    adapter = HTTPAdapter(max_retries=retries)
+    session.mount('https://', adapter)
+    session.mount('http://', adapter)
+    return session
+
+def configure_logging():
+    """Route the test scripts' log output to stdout at LOG_LEVEL; progress lines are printed, logging only carries the DEBUG dumps"""
+    logging.basicConfig(
+        level=os.environ.get('LOG_LEVEL', 'INFO').upper(),
+        format='%(message)s',
+        stream=sys.stdout
+    )
+
 def check_required_vars():
     """Check if required environment variables are set"""
     required_vars = ['GOOGLE_SERVICE_ACCOUNT', 'GOOGLE_SHEET_ID']
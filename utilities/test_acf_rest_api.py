@@ -4,33 +4,19 @@ Test Script to Check ACF REST API Exposure
 Tests which ACF fields are exposed to the WordPress REST API
 """
 
-import requests
 import json
+import logging
 import os
-from pathlib import Path
+import sys
+from concurrent.futures import ThreadPoolExecutor
 
-# Load environment variables
-def load_env_file(env_file_path='.env'):
-    """Load environment variables from .env file"""
-    env_path = Path(env_file_path)
-    
-    if env_path.exists():
-        print(f"📁 Loading environment variables from {env_path}")
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    os.environ[key] = value
-        print("✅ Environment variables loaded")
+# Load environment variables (shared loader lives next to this script)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from load_env import configure_logging, load_env_if_present, make_session
+
+load_env_if_present()
 
-# Load environment variables
-load_env_file()
+log = logging.getLogger(__name__)
 
 class ACFRestAPITester:
     def __init__(self):
@@ -40,10 +26,31 @@ class ACFRestAPITester:
         self.wp_password = os.environ['WORDPRESS_APP_PASSWORD']
         self.auth = (self.wp_username, self.wp_password)
         
+        self.session = make_session(self.auth)
+        
         print(f"🔧 Testing ACF REST API exposure...")
         print(f"   WordPress URL: {self.wp_site_url}")
         print(f"   Username: {self.wp_username}")
     
+    def _fetch_sample_post(self, post_type):
+        """Fetch one post of a type with its ACF block; returns (list_response, full_response or None) or the exception"""
+        try:
+            # Get a sample post of this type; the listing carries the ACF block when it is exposed
+            url = f"{self.wp_site_url}/wp-json/wp/v2/{post_type}s"
+            params = {'per_page': 1, '_fields': 'id,acf'}
+            
+            response = self.session.get(url, params=params, timeout=10)
+            full_response = None
+            if response.status_code == 200:
+                posts = response.json()
+                if posts and 'acf' not in posts[0]:
+                    # Only ask for the single post when the listing left ACF out
+                    full_url = f"{self.wp_site_url}/wp-json/wp/v2/{post_type}s/{posts[0]['id']}"
+                    full_response = self.session.get(full_url, params={'_fields': 'id,acf'}, timeout=10)
+            return response, full_response
+        except Exception as e:
+            return e
+    
     def test_acf_field_exposure(self):
         """Test which ACF fields are exposed to the REST API"""
         print("\n🔍 Testing ACF field exposure to REST API...")
@@ -51,15 +58,17 @@ class ACFRestAPITester:
         # Test different post types
         post_types = ['beach', 'city', 'region']
         
-        for post_type in post_types:
+        # The post types are independent, so fetch them concurrently and report in order
+        with ThreadPoolExecutor(max_workers=len(post_types)) as executor:
+            results = list(executor.map(self._fetch_sample_post, post_types))
+        
+        for post_type, result in zip(post_types, results):
             print(f"\n📋 Testing {post_type} post type...")
             
             try:
-                # Get a sample post of this type
-                url = f"{self.wp_site_url}/wp-json/wp/v2/{post_type}s"
-                params = {'per_page': 1}
-                
-                response = requests.get(url, params=params, auth=self.auth, timeout=10)
+                if isinstance(result, Exception):
+                    raise result
+                response, full_response = result
                 
                 if response.status_code == 200:
                     posts = response.json()
@@ -69,20 +78,19 @@ class ACFRestAPITester:
                         
                         print(f"   Found {post_type} post ID: {post_id}")
                         
-                        # Get the full post with ACF fields
-                        full_url = f"{self.wp_site_url}/wp-json/wp/v2/{post_type}s/{post_id}"
-                        full_response = requests.get(full_url, auth=self.auth, timeout=10)
-                        
-                        if full_response.status_code == 200:
-                            full_post = full_response.json()
+                        if full_response is None or full_response.status_code == 200:
+                            full_post = post if full_response is None else full_response.json()
                             acf_fields = full_post.get('acf', {})
                             
-                            print(f"   📊 ACF fields exposed to REST API:")
-                            if acf_fields:
+                            # Field values can be large repeater arrays; only format them at DEBUG
+                            if not acf_fields:
+                                print(f"   📊 ACF fields exposed to REST API: none found")
+                            elif log.isEnabledFor(logging.DEBUG):
+                                log.debug("   📊 ACF fields exposed to REST API:")
                                 for key, value in acf_fields.items():
-                                    print(f"      - {key}: {value}")
+                                    log.debug("      - %s: %s", key, value)
                             else:
-                                print(f"      No ACF fields found")
+                                print(f"   📊 ACF fields exposed to REST API: {', '.join(acf_fields)}")
                         else:
                             print(f"   ❌ Failed to get full post: {full_response.status_code}")
                     else:
@@ -100,7 +108,7 @@ class ACFRestAPITester:
         try:
             # Try to get ACF field group information via REST API
             url = f"{self.wp_site_url}/wp-json/acf/v3/field-groups"
-            response = requests.get(url, auth=self.auth, timeout=10)
+            response = self.session.get(url, timeout=10)
             
             if response.status_code == 200:
                 field_groups = response.json()
@@ -134,9 +142,9 @@ class ACFRestAPITester:
         try:
             # Find a city post
             url = f"{self.wp_site_url}/wp-json/wp/v2/cities"
-            params = {'per_page': 1}
+            params = {'per_page': 1, '_fields': 'id,title'}
             
-            response = requests.get(url, params=params, auth=self.auth, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 posts = response.json()
@@ -156,10 +164,9 @@ class ACFRestAPITester:
                         }
                     }
                     
-                    update_response = requests.post(
+                    update_response = self.session.post(
                         update_url,
                         json=test_data,
-                        auth=self.auth,
                         headers={'Content-Type': 'application/json'},
                         timeout=15
                     )
@@ -170,9 +177,10 @@ class ACFRestAPITester:
                         result = update_response.json()
                         acf_fields = result.get('acf', {})
                         
-                        print(f"   📊 ACF fields after update:")
-                        for key, value in acf_fields.items():
-                            print(f"      - {key}: {value}")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("   📊 ACF fields after update:")
+                            for key, value in acf_fields.items():
+                                log.debug("      - %s: %s", key, value)
                         
                         # Check if our test field was saved
                         if 'test_field' in acf_fields:
@@ -206,5 +214,7 @@ class ACFRestAPITester:
         print(f"\n🏁 Test complete!")
 
 if __name__ == "__main__":
+    configure_logging()
+    
     tester = ACFRestAPITester()
     tester.run_test()
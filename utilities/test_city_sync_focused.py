@@ -4,36 +4,20 @@ Focused Test Script for City Sync
 Tests city sync with updated child beach finding logic
 """
 
-import requests
 import json
+import logging
 import os
-import time
+import sys
+from concurrent.futures import ThreadPoolExecutor
 from datetime import datetime
-import pytz
-from pathlib import Path
 
-# Load environment variables
-def load_env_file(env_file_path='.env'):
-    """Load environment variables from .env file"""
-    env_path = Path(env_file_path)
-    
-    if env_path.exists():
-        print(f"📁 Loading environment variables from {env_path}")
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    os.environ[key] = value
-        print("✅ Environment variables loaded")
+# Load environment variables (shared loader lives next to this script)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from load_env import configure_logging, load_env_if_present, make_session
+
+load_env_if_present()
 
-# Load environment variables
-load_env_file()
+log = logging.getLogger(__name__)
 
 class FocusedCityTester:
     def __init__(self):
@@ -43,35 +27,52 @@ class FocusedCityTester:
         self.wp_password = os.environ['WORDPRESS_APP_PASSWORD']
         self.auth = (self.wp_username, self.wp_password)
         
+        self.session = make_session(self.auth)
+        
+        # Beach listing shared by every city tested in this run, as (id, title, title_folded, slug_folded)
+        self._all_beaches = None
+        
         print(f"🔧 Testing focused city sync...")
         print(f"   WordPress URL: {self.wp_site_url}")
         print(f"   Username: {self.wp_username}")
     
-    def test_single_city_sync(self, city_name):
+    def _city_slug(self, city_name):
+        """Slug the sync script gives a city post"""
+        return f'{city_name.lower().replace(" ", "-")}-red-tide'
+    
+    def _fetch_city_posts(self, city_names):
+        """Look up several city posts in one request; returns {slug: id}, or None if the search failed"""
+        search_url = f"{self.wp_site_url}/wp-json/wp/v2/cities"
+        slugs = [self._city_slug(city_name) for city_name in city_names]
+        params = [('slug[]', slug) for slug in slugs] + [('per_page', len(slugs)), ('_fields', 'id,slug')]
+        
+        response = self.session.get(search_url, params=params, timeout=10)
+        if response.status_code != 200:
+            print(f"❌ Search failed: {response.status_code}")
+            return None
+        
+        return {post['slug']: post['id'] for post in response.json()}
+    
+    def test_single_city_sync(self, city_name, city_posts=None):
         """Test syncing a single city to see the child beach finding logic"""
         print(f"\n🔍 Testing city sync for: {city_name}")
         
         try:
-            # Find the city post
-            search_url = f"{self.wp_site_url}/wp-json/wp/v2/cities"
-            params = {'slug': f'{city_name.lower().replace(" ", "-")}-red-tide'}
+            # Find the city post (run_test passes in one batched lookup for all cities)
+            if city_posts is None:
+                city_posts = self._fetch_city_posts([city_name])
+                if city_posts is None:
+                    return
             
-            response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
-            
-            if response.status_code == 200:
-                posts = response.json()
-                if posts:
-                    post = posts[0]
-                    post_id = post['id']
-                    print(f"✅ Found {city_name} city post: ID {post_id}")
-                    
-                    # Test the child beach finding logic
-                    self.test_child_beach_finding(city_name)
-                    
-                else:
-                    print(f"❌ {city_name} city post not found")
+            post_id = city_posts.get(self._city_slug(city_name))
+            if post_id is not None:
+                print(f"✅ Found {city_name} city post: ID {post_id}")
+                
+                # Test the child beach finding logic
+                self.test_child_beach_finding(city_name)
+                
             else:
-                print(f"❌ Search failed: {response.status_code}")
+                print(f"❌ {city_name} city post not found")
                 
         except Exception as e:
             print(f"❌ Error testing {city_name}: {e}")
@@ -96,9 +97,10 @@ class FocusedCityTester:
         }
         
         # Simulate the child beach finding logic
-        print(f"   📊 Mock city data:")
-        for key, value in mock_city_data.items():
-            print(f"      - {key}: {value}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("   📊 Mock city data:")
+            for key, value in mock_city_data.items():
+                log.debug("      - %s: %s", key, value)
         
         # Try to find child beaches
         child_beach_ids = self.find_child_beach_ids(city_name)
@@ -110,38 +112,61 @@ class FocusedCityTester:
         else:
             print(f"   ⚠️  No child beaches found - this will cause validation errors")
     
+    def _get_all_beaches(self):
+        """Fetch every beach post once per run, casefolding title/slug once; None if the request failed"""
+        if self._all_beaches is not None:
+            return self._all_beaches
+        
+        search_url = f"{self.wp_site_url}/wp-json/wp/v2/beaches"
+        params = {'per_page': 100, '_fields': 'id,title,slug'}
+        
+        response = self.session.get(search_url, params=params, timeout=10)
+        if response.status_code != 200:
+            print(f"      ❌ Failed to get beaches: {response.status_code}")
+            return None
+        
+        beaches = response.json()
+        
+        # Fetch any remaining pages concurrently instead of one after another
+        total_pages = int(response.headers.get('X-WP-TotalPages', 1))
+        if total_pages > 1:
+            def fetch_page(page):
+                page_response = self.session.get(search_url, params={**params, 'page': page}, timeout=10)
+                return page_response.json() if page_response.status_code == 200 else []
+            
+            with ThreadPoolExecutor(max_workers=min(4, total_pages - 1)) as executor:
+                for page_beaches in executor.map(fetch_page, range(2, total_pages + 1)):
+                    beaches.extend(page_beaches)
+        
+        self._all_beaches = []
+        for beach in beaches:
+            beach_title = beach.get('title', {}).get('rendered', '')
+            beach_slug = beach.get('slug', '')
+            self._all_beaches.append((beach['id'], beach_title, beach_title.casefold(), beach_slug.casefold()))
+        return self._all_beaches
+    
     def find_child_beach_ids(self, city_name):
         """Find child beach post IDs for a city (simplified version)"""
         try:
             # This would normally come from Google Sheets data
             # For testing, let's try to find beaches that belong to this city
+            beaches = self._get_all_beaches()
+            if beaches is None:
+                return []
             
-            # Search for beaches with this city name
-            search_url = f"{self.wp_site_url}/wp-json/wp/v2/beaches"
-            params = {'per_page': 50}  # Get more beaches to search through
+            child_ids = []
+            city_folded = city_name.casefold()
             
-            response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
+            print(f"      🔍 Searching through {len(beaches)} beaches for city '{city_name}'...")
             
-            if response.status_code == 200:
-                beaches = response.json()
-                child_ids = []
-                
-                print(f"      🔍 Searching through {len(beaches)} beaches for city '{city_name}'...")
-                
-                for beach in beaches:
-                    beach_title = beach.get('title', {}).get('rendered', '')
-                    beach_slug = beach.get('slug', '')
-                    
-                    # Check if this beach belongs to the city
-                    # This is a simplified check - in reality we'd use ACF field data
-                    if city_name.lower() in beach_title.lower() or city_name.lower() in beach_slug.lower():
-                        child_ids.append(beach['id'])
-                        print(f"         ✅ Found beach: {beach_title} (ID: {beach['id']})")
-                
-                return child_ids
-            else:
-                print(f"      ❌ Failed to get beaches: {response.status_code}")
-                return []
+            for beach_id, beach_title, title_folded, slug_folded in beaches:
+                # Check if this beach belongs to the city
+                # This is a simplified check - in reality we'd use ACF field data
+                if city_folded in title_folded or city_folded in slug_folded:
+                    child_ids.append(beach_id)
+                    log.debug("         ✅ Found beach: %s (ID: %s)", beach_title, beach_id)
+            
+            return child_ids
                 
         except Exception as e:
             print(f"      ❌ Error finding child beaches: {e}")
@@ -155,12 +180,21 @@ class FocusedCityTester:
         # Test with a few specific cities
         test_cities = ['Sarasota', 'Anna Maria', 'Clearwater']
         
-        for city in test_cities:
-            self.test_single_city_sync(city)
-            time.sleep(1)  # Rate limiting
+        # One slug[] query finds every city post; the beach listing is likewise fetched once
+        try:
+            city_posts = self._fetch_city_posts(test_cities)
+        except Exception as e:
+            print(f"❌ Error searching city posts: {e}")
+            city_posts = None
+        
+        if city_posts is not None:
+            for city in test_cities:
+                self.test_single_city_sync(city, city_posts)
         
         print(f"\n🏁 Test complete!")
 
 if __name__ == "__main__":
+    configure_logging()
+    
     tester = FocusedCityTester()
     tester.run_test()
@@ -9,8 +9,10 @@ import requests
 import time
 from datetime import datetime
 
-# Add the current directory to Python path to import from fetch_hab_data
-sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+# Add the repository root to Python path to import the shared abundance parser
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from hab_abundance import parse_abundance_to_status
 
 def test_fwc_api_directly():
     """Test the FWC API directly"""
@@ -20,8 +22,8 @@ def test_fwc_api_directly():
     
     params = {
         'where': '1=1',
-        'outFields': '*',
-        'outSR': '4326',
+        'outFields': 'HAB_ID,SAMPLE_DATE,Abundance,LOCATION',  # Only the attributes the parser reads
+        'returnGeometry': 'false',
         'f': 'json',
         'orderByFields': 'SAMPLE_DATE DESC',
         'resultRecordCount': 1000
@@ -57,13 +59,14 @@ def test_fwc_data_processing():
     """Test FWC data processing logic"""
     print("\n🌊 Testing FWC data processing logic...")
     
-    # Mock FWC data for testing
+    # Mock FWC data for testing; one timestamp so the whole batch shares a SAMPLE_DATE
+    now_ms = int(datetime.now().timestamp() * 1000)
     mock_fwc_data = {
         'features': [
             {
                 'attributes': {
                     'HAB_ID': 'test_hab_001',
-                    'SAMPLE_DATE': int(datetime.now().timestamp() * 1000),
+                    'SAMPLE_DATE': now_ms,
                     'ABUNDANCE': 'Not Present',
                     'LOCATION': 'Clearwater Beach'
                 }
@@ -71,54 +74,25 @@ def test_fwc_data_processing():
             {
                 'attributes': {
                     'HAB_ID': 'test_hab_002',
-                    'SAMPLE_DATE': int(datetime.now().timestamp() * 1000),
+                    'SAMPLE_DATE': now_ms,
                     'ABUNDANCE': 'Low (5,000-10,000 cells/L)',
                     'LOCATION': 'Siesta Key'
                 }
+            },
+            {
+                'attributes': {
+                    'HAB_ID': 'test_hab_003',
+                    'SAMPLE_DATE': now_ms,
+                    'ABUNDANCE': '',
+                    'LOCATION': 'Lido Key'
+                }
             }
         ]
     }
     
     print(f"📊 Testing with {len(mock_fwc_data['features'])} mock features")
     
-    # Test the parsing logic
-    def parse_abundance_to_status(abundance_text):
-        """Convert FWC abundance categories to status and cell count"""
-        if not abundance_text:
-            return 0, 'no_data'
-        
-        abundance_lower = abundance_text.lower()
-        
-        # Extract numbers from text
-        import re
-        numbers = re.findall(r'[\d,]+', abundance_text)
-        
-        if 'not present' in abundance_lower or 'background' in abundance_lower:
-            return 500, 'safe'
-        elif 'very low' in abundance_lower:
-            return 2500, 'safe'
-        elif 'low' in abundance_lower and 'very' not in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'caution'
-            return 5000, 'caution'
-        elif 'medium' in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'avoid'
-            return 50000, 'avoid'
-        elif 'high' in abundance_lower:
-            if len(numbers) >= 2:
-                low = int(numbers[0].replace(',', ''))
-                high = int(numbers[1].replace(',', ''))
-                return (low + high) // 2, 'avoid'
-            return 500000, 'avoid'
-        
-        return 0, 'no_data'
-    
-    # Test parsing
+    # Test parsing with the production parser
     for feature in mock_fwc_data['features']:
         attrs = feature['attributes']
         abundance = attrs.get('ABUNDANCE', '')
@@ -0,0 +1,69 @@
+#!/usr/bin/env python3
+"""
+Test that a post's payload hash does not depend on Python's string hash seed
+"""
+
+import sys
+import os
+import subprocess
+
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# Builds a city payload from mock sheet rows (no Google Sheets or WordPress calls) and prints its hash
+CITY_PAYLOAD_SCRIPT = '''
+import zlib
+from unittest import mock
+
+import sync_to_wordpress as S
+
+REGION = 'Southwest Florida'
+CITIES = ['Sarasota', 'Venice', 'Englewood', 'Nokomis', 'Osprey', 'Longboat Key']
+BEACHES = ['Lido Beach', 'Siesta Key', 'Turtle Beach', 'Crescent Beach', 'North Jetty',
+           'Point of Rocks', 'South Lido', 'Ted Sperling Park']
+
+status_rows = [{'location_name': beach, 'location_type': 'beach', 'region': REGION, 'city': 'Sarasota',
+                'current_status': 'safe'} for beach in BEACHES]
+status_rows += [{'location_name': city, 'location_type': 'city', 'region': REGION, 'city': city,
+                 'current_status': 'caution'} for city in CITIES]
+sheets = {'beach_status': status_rows, 'locations': [], 'sample_mapping': []}
+
+def prefetch_post_ids(self, location_names, post_type):
+    for location_name in location_names:
+        self.location_to_post_id[post_type][location_name] = zlib.crc32(location_name.encode()) % 10000
+
+with mock.patch.object(S.WordPressSyncer, '_init_google_sheets'), \\
+        mock.patch.object(S.WordPressSyncer, '_test_wordpress_auth'), \\
+        mock.patch.object(S.WordPressSyncer, '_fetch_worksheets_batch', return_value=sheets), \\
+        mock.patch.object(S.WordPressSyncer, '_prefetch_post_ids_by_type', prefetch_post_ids), \\
+        mock.patch.object(S.WordPressSyncer, 'find_existing_post', return_value=None):
+    syncer = S.WordPressSyncer()
+    city = {'location_name': 'Sarasota', 'current_status': 'caution', 'slug': 'sarasota', 'region': REGION}
+    print(S._payload_hash(syncer._prepare_post_data(city, 'city')))
+'''
+
+def city_payload_hash(hash_seed):
+    """Hash of the mock city payload built in a fresh interpreter with the given PYTHONHASHSEED"""
+    env = dict(os.environ, PYTHONHASHSEED=str(hash_seed), PYTHONPATH=REPO_ROOT,
+               WORDPRESS_SITE_URL='https://wp.test', WORDPRESS_USERNAME='user', WORDPRESS_APP_PASSWORD='pass')
+    result = subprocess.run([sys.executable, '-c', CITY_PAYLOAD_SCRIPT], env=env, cwd=REPO_ROOT,
+                            capture_output=True, text=True, check=True)
+    return result.stdout.strip().splitlines()[-1]
+
+def test_city_payload_hash_is_stable_across_hash_seeds():
+    """The same city payload hashes the same whatever order its name sets iterate in"""
+    first_hash = city_payload_hash(1)
+    second_hash = city_payload_hash(2)
+    print(f"PYTHONHASHSEED=1: {first_hash}")
+    print(f"PYTHONHASHSEED=2: {second_hash}")
+    assert first_hash == second_hash
+
+if __name__ == "__main__":
+    print("Testing payload hash stability across hash seeds...")
+
+    try:
+        test_city_payload_hash_is_stable_across_hash_seeds()
+        print("\n✅ All tests passed!")
+    except Exception as e:
+        print(f"\n❌ Test failed: {e}")
+        import traceback
+        traceback.print_exc()
@@ -4,36 +4,21 @@ Test Script for Sarasota City ACF Fields
 Tests writing and reading ACF field data for Sarasota city post
 """
 
-import requests
 import json
+import logging
 import os
+import sys
 import time
 from datetime import datetime
-import pytz
-from pathlib import Path
+from zoneinfo import ZoneInfo
 
-# Load environment variables
-def load_env_file(env_file_path='.env'):
-    """Load environment variables from .env file"""
-    env_path = Path(env_file_path)
-    
-    if env_path.exists():
-        print(f"📁 Loading environment variables from {env_path}")
-        with open(env_path, 'r') as f:
-            for line in f:
-                line = line.strip()
-                if line and not line.startswith('#') and '=' in line:
-                    key, value = line.split('=', 1)
-                    key = key.strip()
-                    value = value.strip()
-                    if (value.startswith('"') and value.endswith('"')) or \
-                       (value.startswith("'") and value.endswith("'")):
-                        value = value[1:-1]
-                    os.environ[key] = value
-        print("✅ Environment variables loaded")
+# Load environment variables (shared loader lives next to this script)
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+from load_env import configure_logging, load_env_if_present, make_session
+
+load_env_if_present()
 
-# Load environment variables
-load_env_file()
+log = logging.getLogger(__name__)
 
 class SarasotaCityTester:
     def __init__(self):
@@ -43,25 +28,37 @@ class SarasotaCityTester:
         self.wp_password = os.environ['WORDPRESS_APP_PASSWORD']
         self.auth = (self.wp_username, self.wp_password)
         
+        self.session = make_session(self.auth)
+        
+        # Sarasota city post, looked up once per run
+        self._sarasota_post = None
+        
+        # Resolve the Eastern timezone once for ACF timestamps
+        self._eastern = ZoneInfo('America/New_York')
+        
         print(f"🔧 Testing Sarasota city ACF fields...")
         print(f"   WordPress URL: {self.wp_site_url}")
         print(f"   Username: {self.wp_username}")
     
     def find_sarasota_city_post(self):
-        """Find the Sarasota city post"""
+        """Find the Sarasota city post (cached after the first successful lookup)"""
+        if self._sarasota_post is not None:
+            return self._sarasota_post
+        
         print("\n🔍 Searching for Sarasota city post...")
         
         try:
             search_url = f"{self.wp_site_url}/wp-json/wp/v2/cities"
-            params = {'slug': 'sarasota-red-tide'}
+            params = {'slug': 'sarasota-red-tide', '_fields': 'id'}
             
-            response = requests.get(search_url, params=params, auth=self.auth, timeout=10)
+            response = self.session.get(search_url, params=params, timeout=10)
             
             if response.status_code == 200:
                 posts = response.json()
                 if posts:
                     post = posts[0]
                     print(f"✅ Found Sarasota city post: ID {post['id']}")
+                    self._sarasota_post = post
                     return post
                 else:
                     print("❌ Sarasota city post not found")
@@ -83,23 +80,21 @@ class SarasotaCityTester:
             url = f"{self.wp_site_url}/wp-json/wp/v2/cities/{post_id}"
             params = {'_fields': 'id,title,acf'}
             
-            response = requests.get(url, params=params, auth=self.auth, timeout=10)
+            response = self.session.get(url, params=params, timeout=10)
             
             if response.status_code == 200:
                 post_data = response.json()
                 acf_fields = post_data.get('acf', {})
                 
-                print("📊 Current ACF field values:")
-                print(f"   - peak_cell_count: {acf_fields.get('peak_cell_count', 'NOT SET')}")
-                print(f"   - average_cell_count: {acf_fields.get('average_cell_count', 'NOT SET')}")
-                print(f"   - average_confidence: {acf_fields.get('average_confidence', 'NOT SET')}")
-                print(f"   - latest_sample_data: {acf_fields.get('latest_sample_data', 'NOT SET')}")
-                print(f"   - total_beaches: {acf_fields.get('total_beaches', 'NOT SET')}")
-                print(f"   - beaches_safe: {acf_fields.get('beaches_safe', 'NOT SET')}")
-                print(f"   - beaches_caution: {acf_fields.get('beaches_caution', 'NOT SET')}")
-                print(f"   - beaches_avoid: {acf_fields.get('beaches_avoid', 'NOT SET')}")
-                print(f"   - child_beaches: {acf_fields.get('child_beaches', 'NOT SET')}")
-                print(f"   - parent_region: {acf_fields.get('parent_region', 'NOT SET')}")
+                # One write for the whole listing
+                fields_to_show = [
+                    'peak_cell_count', 'average_cell_count', 'average_confidence',
+                    'latest_sample_data', 'total_beaches', 'beaches_safe',
+                    'beaches_caution', 'beaches_avoid', 'child_beaches', 'parent_region'
+                ]
+                print("📊 Current ACF field values:\n" + "\n".join(
+                    f"   - {field}: {acf_fields.get(field, 'NOT SET')}" for field in fields_to_show
+                ))
                 
                 return acf_fields
             else:
@@ -111,14 +106,14 @@ class SarasotaCityTester:
             return None
     
     def update_sarasota_acf_fields(self, post_id):
-        """Update Sarasota city post with test ACF field data"""
+        """Update Sarasota city post with test ACF field data; returns (success, ACF values from the response or None)"""
         print(f"\n✏️  Updating Sarasota city post ID {post_id} with test ACF data...")
         
         # Test ACF data for Sarasota
         test_acf_data = {
             'current_status': 'caution',  # Required field
             'status_color': '#ffc107',    # Required field
-            'last_updated': datetime.now(pytz.timezone('US/Eastern')).strftime('%Y-%m-%d %H:%M:%S'),
+            'last_updated': datetime.now(self._eastern).strftime('%Y-%m-%d %H:%M:%S'),
             'url_slug': 'sarasota-red-tide',
             'region': 'Southwest Florida',
             'state': 'FL',
@@ -139,9 +134,10 @@ class SarasotaCityTester:
             'nearby_beaches': []
         }
         
-        print("📝 Test ACF data to be written:")
-        for key, value in test_acf_data.items():
-            print(f"   - {key}: {value}")
+        if log.isEnabledFor(logging.DEBUG):
+            log.debug("📝 Test ACF data to be written:")
+            for key, value in test_acf_data.items():
+                log.debug("   - %s: %s", key, value)
         
         try:
             url = f"{self.wp_site_url}/wp-json/wp/v2/cities/{post_id}"
@@ -152,13 +148,12 @@ class SarasotaCityTester:
             }
             
             print(f"\n📤 Sending update request to: {url}")
-            print(f"📦 Payload: {json.dumps(update_payload, indent=2)}")
+            if log.isEnabledFor(logging.DEBUG):
+                log.debug("📦 Payload: %s", json.dumps(update_payload, indent=2))
             
-            response = requests.post(
+            response = self.session.post(
                 url,
                 json=update_payload,
-                auth=self.auth,
-                headers={'Content-Type': 'application/json'},
                 timeout=15
             )
             
@@ -168,27 +163,30 @@ class SarasotaCityTester:
             if response.status_code in [200, 201]:
                 result = response.json()
                 print(f"✅ Update successful!")
-                print(f"📊 Response data: {json.dumps(result, indent=2)}")
+                if log.isEnabledFor(logging.DEBUG):
+                    log.debug("📊 Response data: %s", json.dumps(result, indent=2))
                 
                 # Check if ACF fields are in the response
+                acf_response = None
                 if 'acf' in result:
                     print(f"✅ ACF fields found in response!")
                     acf_response = result['acf']
-                    print(f"📊 ACF fields in response:")
-                    for key, value in acf_response.items():
-                        print(f"   - {key}: {value}")
+                    if log.isEnabledFor(logging.DEBUG):
+                        log.debug("📊 ACF fields in response:")
+                        for key, value in acf_response.items():
+                            log.debug("   - %s: %s", key, value)
                 else:
                     print(f"⚠️  No ACF fields found in response")
                 
-                return True
+                return True, acf_response
             else:
                 print(f"❌ Update failed: {response.status_code}")
                 print(f"❌ Error response: {response.text}")
-                return False
+                return False, None
                 
         except Exception as e:
             print(f"❌ Error updating post: {e}")
-            return False
+            return False, None
     
     def test_acf_field_names(self, post_id):
         """Test if ACF field names are correct by trying different variations"""
@@ -239,11 +237,9 @@ class SarasotaCityTester:
                 url = f"{self.wp_site_url}/wp-json/wp/v2/cities/{post_id}"
                 update_payload = {'acf': variation['fields']}
                 
-                response = requests.post(
+                response = self.session.post(
                     url,
                     json=update_payload,
-                    auth=self.auth,
-                    headers={'Content-Type': 'application/json'},
                     timeout=15
                 )
                 
@@ -253,9 +249,10 @@ class SarasotaCityTester:
                     
                     if 'acf' in result:
                         acf_response = result['acf']
-                        print(f"📊 ACF fields returned:")
-                        for key, value in acf_response.items():
-                            print(f"   - {key}: {value}")
+                        if log.isEnabledFor(logging.DEBUG):
+                            log.debug("📊 ACF fields returned:")
+                            for key, value in acf_response.items():
+                                log.debug("   - %s: %s", key, value)
                     else:
                         print(f"⚠️  No ACF fields in response")
                 else:
@@ -284,13 +281,14 @@ class SarasotaCityTester:
         current_acf = self.read_current_acf_fields(post_id)
         
         # 3. Update with test data
-        update_success = self.update_sarasota_acf_fields(post_id)
+        update_success, updated_acf = self.update_sarasota_acf_fields(post_id)
         
         if update_success:
-            # 4. Read ACF fields again to verify
-            print(f"\n🔍 Verifying update...")
-            time.sleep(2)  # Wait for update to process
-            updated_acf = self.read_current_acf_fields(post_id)
+            # 4. WordPress answers the update with the post as saved; only re-read when it left out the ACF fields
+            if updated_acf is None:
+                print(f"\n🔍 Verifying update...")
+                time.sleep(2)  # Wait for update to process
+                updated_acf = self.read_current_acf_fields(post_id)
             
             # 5. Compare before and after
             if current_acf and updated_acf:
@@ -301,11 +299,14 @@ class SarasotaCityTester:
                     'beaches_caution', 'beaches_avoid'
                 ]
                 
+                # One pass over the fields, printed as a single write
+                rows = []
                 for field in fields_to_check:
                     before = current_acf.get(field, 'NOT SET')
                     after = updated_acf.get(field, 'NOT SET')
                     status = "✅ CHANGED" if before != after else "❌ NO CHANGE"
-                    print(f"   {field}: {before} → {after} {status}")
+                    rows.append(f"   {field}: {before} → {after} {status}")
+                print("\n".join(rows))
         
         # 6. Test field name variations
         self.test_acf_field_names(post_id)
@@ -313,5 +314,7 @@ class SarasotaCityTester:
         print(f"\n🏁 Test complete!")
 
 if __name__ == "__main__":
+    configure_logging()
+    
     tester = SarasotaCityTester()
     tester.run_test()
@@ -7,8 +7,18 @@ Quick check to see if the beach_status sheet headers are correct
 import os
 import json
 import gspread
+from gspread.utils import absolute_range_name
 from google.oauth2.service_account import Credentials
 
+# Expected beach_status header row, in column order
+EXPECTED_HEADERS = [
+    'location_name', 'location_type', 'date', 'current_status',
+    'peak_count', 'avg_count', 'confidence_score', 'sample_date', 'last_updated',
+    'region', 'city', 'slug', 'beach_count', 'city_count', 
+    'beaches_safe', 'beaches_caution', 'beaches_avoid'
+]
+EXPECTED_HEADER_SET = frozenset(EXPECTED_HEADERS)
+
 def verify_headers():
     """Verify the beach_status sheet headers"""
     
@@ -30,10 +40,8 @@ def verify_headers():
         
         print("🔍 Verifying Google Sheet headers...")
         
-        worksheet = sheet.worksheet('beach_status')
-        
-        # Get headers
-        all_values = worksheet.get_all_values()
+        # One values.get for header + data rows; worksheet() would first fetch the spreadsheet metadata
+        all_values = sheet.values_get(absolute_range_name('beach_status')).get('values', [])
         if not all_values:
             print("❌ Sheet is empty")
             return
@@ -56,20 +64,12 @@ def verify_headers():
         else:
             print("✅ No duplicate headers found")
         
-        # Define expected headers
-        expected_headers = [
-            'location_name', 'location_type', 'date', 'current_status',
-            'peak_count', 'avg_count', 'confidence_score', 'sample_date', 'last_updated',
-            'region', 'city', 'slug', 'beach_count', 'city_count', 
-            'beaches_safe', 'beaches_caution', 'beaches_avoid'
-        ]
-        
-        print(f"\n🎯 Expected headers ({len(expected_headers)} columns):")
-        for i, header in enumerate(expected_headers, 1):
+        print(f"\n🎯 Expected headers ({len(EXPECTED_HEADERS)} columns):")
+        for i, header in enumerate(EXPECTED_HEADERS, 1):
             print(f"   {i:2d}. {header}")
         
         # Check if headers match
-        if headers == expected_headers:
+        if headers == EXPECTED_HEADERS:
             print("\n✅ Headers are correct!")
             print("   Your sync script should work properly.")
         else:
@@ -77,25 +77,26 @@ def verify_headers():
             print("   Run: python fix_sheet_headers.py to fix this")
             
             # Show differences
-            if len(headers) != len(expected_headers):
-                print(f"   - Expected {len(expected_headers)} columns, found {len(headers)}")
+            if len(headers) != len(EXPECTED_HEADERS):
+                print(f"   - Expected {len(EXPECTED_HEADERS)} columns, found {len(headers)}")
             
             # Check for missing headers
-            missing = set(expected_headers) - set(headers)
+            header_set = set(headers)
+            missing = EXPECTED_HEADER_SET - header_set
             if missing:
                 print(f"   - Missing headers: {list(missing)}")
             
             # Check for extra headers
-            extra = set(headers) - set(expected_headers)
+            extra = header_set - EXPECTED_HEADER_SET
             if extra:
                 print(f"   - Extra headers: {list(extra)}")
         
-        # Test if get_all_records works
-        try:
-            records = worksheet.get_all_records()
-            print(f"\n✅ Successfully loaded {len(records)} records")
-        except Exception as e:
-            print(f"\n❌ Cannot load records: {e}")
+        # Records are the rows under the header, already in hand; get_all_records() would read the sheet twice more,
+        # and like it they can't be keyed by a header row with duplicates
+        if duplicate_headers:
+            print("\n❌ Cannot load records: the header row has duplicate headers")
+        else:
+            print(f"\n✅ Successfully loaded {len(all_values) - 1} records")
             
     except Exception as e:
         print(f"❌ Error verifying headers: {e}")